@@ -14,7 +14,7 @@ import {
 import { Badge } from '@/components/ui/badge'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { IconWorld, IconBuildingFactory2, IconMicrophone, IconChevronDown, IconTrendingUp, IconTrendingDown, IconChartLine } from '@tabler/icons-react'
-import { fetchIndexGraph, fetchChartData, fetchTariffProb, type Universe, type ChartDataResponse } from '@/lib/api'
+import { fetchDashboardBundle, fetchChartData, fetchTariffProb, type Universe, type ChartDataResponse } from '@/lib/api'
 const COUNTRIES = [
   { code: "CN", name: "China", flag: "🇨🇳" },
   { code: "EU", name: "European Union", flag: "🇪🇺"},
@@ -129,18 +129,15 @@ export default function Page() {
     })
   }, [selectedUniverse, selectedSector])
 
-  // Fetch projected index prices on mount (for market cards)
+  // Fetch projected index prices on mount (for market cards) — all three
+  // index graphs arrive in one bundle request.
   useEffect(() => {
-    const indices = [
-      { type: 'nasdaq'   as const, key: 'nasdaq' },
-      { type: 'sp500'    as const, key: 'sp500'  },
-      { type: 'dowjones' as const, key: 'dow'    },
-    ]
-    indices.forEach(({ type, key }) => {
-      fetchIndexGraph(type).then(data => {
-        if (data?.points?.length) {
-          const latest = data.points[data.points.length - 1]
-          setIndexPrices(prev => ({ ...prev, [key]: latest.price }))
+    const keys = { nasdaq: 'nasdaq', sp500: 'sp500', dowjones: 'dow' } as const
+    fetchDashboardBundle().then(data => {
+      data?.indices.forEach(({ graph_type, points }) => {
+        if (points.length) {
+          const latest = points[points.length - 1]
+          setIndexPrices(prev => ({ ...prev, [keys[graph_type]]: latest.price }))
         }
       })
     })
@@ -141,4 +141,36 @@ export async function fetchTariffProb(
   } catch {
     return null
   }
-}
\ No newline at end of file
+}
+
+export interface DashboardBundle {
+  country: string | null
+  sector: string | null
+  tariff_prob: { country: string; sector: string; probability_percent: number } | null
+  sectors: { sector: string; probability_percent: number }[]
+  // Only the index graphs that loaded; a failed one is left out
+  indices: { graph_type: "nasdaq" | "sp500" | "dowjones"; points: { date: string; price: number }[] }[]
+}
+
+// One round-trip for the dashboard's initial reads (tariff prob, sector list,
+// and the three index graphs). country/sector are optional.
+export async function fetchDashboardBundle(
+  country?: string,
+  sector?: string,
+): Promise<DashboardBundle | null> {
+  try {
+    const params = new URLSearchParams()
+    if (country) params.set("country", country)
+    if (sector) params.set("sector", sector)
+
+    const res = await fetch(
+      `${BACKEND}/api/dashboard/bundle?${params}`,
+      { cache: "no-store" },
+    )
+
+    if (!res.ok) return null
+    return await res.json()
+  } catch {
+    return null
+  }
+}
@@ -19,12 +19,18 @@ Required env vars (add to project-root .env or .env.local):
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
+from contextlib import asynccontextmanager
 
 import snowflake.connector
+from cachetools import TTLCache
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from ..core.semantic_cache import SemanticCache
+
 router = APIRouter(prefix="/api/chatbot", tags=["chatbot"])
 
 _ACCOUNT  = os.getenv("SNOWFLAKE_ACCOUNT",  "")
@@ -34,6 +40,10 @@ _HOST     = os.getenv("SNOWFLAKE_HOST",     "")
 _ROLE     = os.getenv("SNOWFLAKE_ROLE",     "")
 _MODEL    = os.getenv("SNOWFLAKE_MODEL",    "llama3.1-8b")
 
+_POOL_SIZE           = 4
+_CONTEXT_TTL_SECONDS = 300
+_NO_CONTEXT = "No tariff data available."
+
 _SYSTEM_PROMPT = (
     "You are Quantara, a supply chain risk analyst specializing in U.S. tariff policy. "
     "Answer the user's question using the tariff data context provided. "
@@ -68,21 +78,140 @@ def _connect() -> snowflake.connector.SnowflakeConnection:
         host=_HOST,
         port=443,
         role=_ROLE,
+        # Pooled connections sit idle between chats; the heartbeat keeps the
+        # session from hitting Snowflake's idle timeout.
+        client_session_keep_alive=True,
     )
 
 
-def _get_tariff_context(cursor) -> str:
+class _ConnectionPool:
+    """
+    Small bounded pool of warm Snowflake connections.
+
+    A semaphore bounds checkouts to `size`; the queue only holds idle
+    connections. A waiter gets a slot as soon as any checkout ends, and then
+    reuses an idle connection or opens a new one, so a connection that
+    raised during use (closed instead of being returned) never strands it.
+    An idle connection found closed at checkout is replaced.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size    = size
+        self._slots   = asyncio.Semaphore(size)
+        self._idle: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self._created = 0
+
+    async def _new(self) -> snowflake.connector.SnowflakeConnection:
+        self._created += 1
+        try:
+            return await asyncio.to_thread(_connect)
+        except Exception:
+            self._created -= 1
+            raise
+
+    async def open(self) -> None:
+        while self._created < self._size:
+            self._idle.put_nowait(await self._new())
+
+    async def close(self) -> None:
+        while not self._idle.empty():
+            conn = self._idle.get_nowait()
+            self._created -= 1
+            await asyncio.to_thread(conn.close)
+
+    async def _checkout(self) -> snowflake.connector.SnowflakeConnection:
+        while not self._idle.empty():
+            conn = self._idle.get_nowait()
+            if not conn.is_closed():
+                return conn
+            self._created -= 1   # dropped by the server; replace it
+        return await self._new()
+
+    @asynccontextmanager
+    async def connection(self):
+        async with self._slots:
+            conn = await self._checkout()
+            try:
+                yield conn
+            except BaseException:
+                self._created -= 1
+                await asyncio.to_thread(conn.close)
+                raise
+            else:
+                self._idle.put_nowait(conn)
+
+
+_pool = _ConnectionPool(_POOL_SIZE)
+
+
+def _is_configured() -> bool:
+    return all([_ACCOUNT, _USER, _PASSWORD, _HOST])
+
+
+async def open_pool() -> None:
+    """Pre-warm the connection pool (called from the app startup hook)."""
+    if _is_configured():
+        await _pool.open()
+
+
+async def close_pool() -> None:
+    await _pool.close()
+
+
+# Near-duplicate questions ("China tariffs?" vs "current China tariff rate")
+# are answered from memory when the tariff context hasn't changed.
+_response_cache = SemanticCache(threshold=0.92)
+
+
+async def load_semantic_cache() -> bool:
+    """Load the embedding model off the event loop (called from the app startup hook)."""
+    return await asyncio.to_thread(_response_cache.load)
+
+
+def _get_tariff_context(conn) -> str:
+    # COUNTRY_TARIFF_RISK mirrors ml/artifacts/country_sector_tariff_probs.csv;
+    # only the columns the LLM needs are pulled.
     try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT country, sector, tariff_risk_pct "
+                "FROM HACKLYTICS_DB.PUBLIC.COUNTRY_TARIFF_RISK LIMIT 500;"
+            )
+            return "Tariff Risk Data Context:\n" + "\n".join(
+                ",".join(str(c) for c in row) for row in cursor.fetchall()
+            )
+    except Exception:
+        return _NO_CONTEXT
+
+
+def _complete(conn, prompt: str) -> str:
+    with conn.cursor() as cursor:
+        # Bind parameters: no manual quoting, and the statement text is stable.
         cursor.execute(
-            "SELECT * FROM HACKLYTICS_DB.PUBLIC.COUNTRY_TARIFF_RISK LIMIT 500;"
+            "SELECT SNOWFLAKE.CORTEX.COMPLETE(%s, %s)", (_MODEL, prompt)
         )
-        rows = cursor.fetchall()
-        context = "Tariff Risk Data Context:\n"
-        for row in rows:
-            context += f"{row}\n"
-        return context
-    except Exception:
-        return "No tariff data available."
+        return cursor.fetchone()[0]
+
+
+# The tariff table changes rarely, so the rendered context is shared across
+# requests for a few minutes. The lock collapses concurrent misses into a
+# single Snowflake query; only a miss checks out a pooled connection.
+_CTX_CACHE: TTLCache = TTLCache(maxsize=1, ttl=_CONTEXT_TTL_SECONDS)
+_CTX_LOCK = asyncio.Lock()
+
+
+async def _get_tariff_context_cached() -> str:
+    ctx = _CTX_CACHE.get("ctx")
+    if ctx is not None:
+        return ctx
+    async with _CTX_LOCK:
+        ctx = _CTX_CACHE.get("ctx")
+        if ctx is None:
+            async with _pool.connection() as conn:
+                ctx = await asyncio.to_thread(_get_tariff_context, conn)
+            if ctx != _NO_CONTEXT:
+                _CTX_CACHE["ctx"] = ctx
+        return ctx
 
 
 # ── Endpoint ───────────────────────────────────────────────────────────────────
@@ -92,7 +221,7 @@ async def chat(req: ChatRequest) -> ChatResponse:
     """
     Send a message to the Snowflake Cortex LLM with tariff data context injected.
     """
-    if not all([_ACCOUNT, _USER, _PASSWORD, _HOST]):
+    if not _is_configured():
         raise HTTPException(
             status_code=503,
             detail=(
@@ -103,10 +232,14 @@ async def chat(req: ChatRequest) -> ChatResponse:
         )
 
     try:
-        conn   = _connect()
-        cursor = conn.cursor()
+        # Connections are checked out only around Snowflake calls: the
+        # embedding lookup below runs without holding one of the pool's slots.
+        tariff_data = await _get_tariff_context_cached()
+        ctx_hash    = hashlib.blake2b(tariff_data.encode(), digest_size=16).hexdigest()
 
-        tariff_data = _get_tariff_context(cursor)
+        cached = await asyncio.to_thread(_response_cache.lookup, req.message, ctx_hash)
+        if cached is not None:
+            return ChatResponse(response=cached)
 
         augmented_prompt = (
             f"{_SYSTEM_PROMPT}\n\n"
@@ -114,16 +247,10 @@ async def chat(req: ChatRequest) -> ChatResponse:
             f"User Question: {req.message}"
         )
 
-        # Escape single quotes so they don't break the SQL string literal
-        escaped = augmented_prompt.replace("'", "\\'")
-        cursor.execute(
-            f"SELECT SNOWFLAKE.CORTEX.COMPLETE('{_MODEL}', '{escaped}')"
-        )
-        result = cursor.fetchone()[0]
-
-        cursor.close()
-        conn.close()
+        async with _pool.connection() as conn:
+            result = await asyncio.to_thread(_complete, conn, augmented_prompt)
 
+        await asyncio.to_thread(_response_cache.store, req.message, ctx_hash, result)
         return ChatResponse(response=result)
 
     except HTTPException:
@@ -135,5 +262,5 @@ async def chat(req: ChatRequest) -> ChatResponse:
 @router.get("/health")
 async def chatbot_health() -> dict:
     """Check whether Snowflake credentials are present (does not actually connect)."""
-    configured = all([_ACCOUNT, _USER, _PASSWORD, _HOST])
+    configured = _is_configured()
     return {"configured": configured, "model": _MODEL}
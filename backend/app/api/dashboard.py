@@ -5,11 +5,30 @@ Endpoints
 ---------
 GET /api/dashboard/tariff-prob?country=...&sector=...
     Returns tariff probability % for a (country, sector) pair.
+    Served from an in-memory copy of country_tariff_prob (core/tariff_probs.py).
 
-GET /api/dashboard/graph?graph_type=...&sector=...
-    Returns time-series data sampled at 2-week intervals.
+GET /api/dashboard/graph?graph_type=...&sector=...&format=...&since=...
+    Returns time-series data sampled at 2-week intervals (one point per 14-day
+    bucket), LTTB-reduced further only if a series would exceed 200 points.
     graph_type: "nasdaq" | "sp500" | "dowjones" | "top10_sector_stocks"
     sector:     required only when graph_type == "top10_sector_stocks"
+    format:     "points" (default) | "columnar" — top-10 only: per-ticker
+                parallel arrays instead of one object per point
+    since:      optional YYYY-MM-DD — index graphs only: rows before it are
+                filtered out in Postgres, before down-sampling
+
+GET /api/dashboard/bundle?country=...&sector=...
+    Everything the dashboard page needs on load in one round-trip: the
+    tariff probability (when both are given), the country's sector list
+    (as /api/map/country-sectors) and the three index graphs.
+
+/tariff-prob, /graph and /bundle send ETag + Cache-Control headers and answer a
+matching If-None-Match with 304 Not Modified.
+
+POST /api/dashboard/cache/clear   (header X-Admin-Token: $DASHBOARD_ADMIN_TOKEN)
+    Refreshes the biweekly materialized views (if installed) and drops all
+    cached responses. Call after re-ingesting data into Supabase. Disabled
+    (403) unless DASHBOARD_ADMIN_TOKEN is set; a wrong token gets a 401.
 
 ---
 Actual Supabase schema (verified against live DB)
@@ -27,26 +46,60 @@ Tables: {Sector}_top10  (e.g. Energy_top10, Agriculture_top10, Steel_aluminum_to
   id, date, sector, ticker, baseline_price, impacted_price,
   normalized_impacted_price, sector_total_impact_pct
   -> long format; group by ticker, use `impacted_price`
+
+Optional Postgres objects (backend/sql/*.sql)
+--------------------------------------------
+Views: mv_index_paths_biweekly, mv_{sector}_top10_biweekly
+  -> rows pre-thinned to 14-day buckets in Postgres (smaller transfer). When
+     they are absent /graph reads the full tables and applies the same
+     bucketing in Python (_biweekly), so the response is the same either way.
+     Refreshed by refresh_dashboard_views() via /cache/clear.
+RPC: sector_daily_avg(tbl)
+  -> per-date AVG(baseline_price), AVG(impacted_price) for /chart-data;
+     falls back to averaging the per-ticker rows in Python
 """
 
 from __future__ import annotations
 
+import asyncio
+import csv
+import functools
+import hashlib
+import hmac
+import io
+from array import array
 from collections import defaultdict
-from datetime import date as _date
-from typing import Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import date as _date, timedelta
+from itertools import groupby
+from operator import itemgetter
+from typing import Literal, Optional
+
+import numpy as np
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from supabase import Client
 
+try:   # optional: JIT-compiled LTTB kernel
+    from numba import njit
+except ImportError:
+    njit = None
+
+from ..core import tariff_probs
+from ..core.config import get_admin_token
 from ..core.supabase import get_supabase
 from ..models.responses import (
     ChartDataResponse,
     ChartSeries,
+    DashboardBundleResponse,
     DatePricePoint,
     IndexGraphResponse,
+    SectorProbability,
+    SectorTop10ColumnarResponse,
     SectorTop10Response,
     SeriesPoint,
     TariffProbResponse,
+    TickerColumns,
     TickerSeries,
 )
 
@@ -61,7 +114,26 @@ _INDEX_VALUE_MAP: dict[str, str] = {
     "dowjones": "dow",   # DB stores "dow", not "dowjones"
 }
 
-_VALID_GRAPH_TYPES = set(_INDEX_VALUE_MAP.keys()) | {"top10_sector_stocks"}
+# Accepted query values; FastAPI rejects anything else with a 422 at parse time.
+_GraphType = Literal["nasdaq", "sp500", "dowjones", "top10_sector_stocks"]
+_GraphFormat = Literal["points", "columnar"]
+_Universe  = Literal["sp500", "dow", "nasdaq", "sector_top10"]
+
+# Maps normalised sector name (stripped, lower-case) -> Supabase table-name
+# stem; tables are "{stem}_top10" and "{stem}_index".
+_SECTOR_TABLE_STEM: dict[str, str] = {
+    "aerospace":          "Aerospace",
+    "agriculture":        "Agriculture",
+    "automotive":         "Automotive",
+    "energy":             "Energy",
+    "lumber":             "Lumber",
+    "maritime":           "Maritime",
+    "metals":             "Metals",
+    "minerals":           "Minerals",
+    "pharmaceuticals":    "Pharmaceuticals",
+    "steel and aluminum": "Steel_aluminum",
+    "steel & aluminum":   "Steel_aluminum",
+}
 
 # Maps universe key (chart-data endpoint) -> value stored in Index_paths.index column.
 _UNIVERSE_INDEX_MAP: dict[str, str] = {
@@ -70,8 +142,6 @@ _UNIVERSE_INDEX_MAP: dict[str, str] = {
     "dow":    "dow",
 }
 
-_VALID_UNIVERSES = set(_UNIVERSE_INDEX_MAP.keys()) | {"sector_top10"}
-
 # Maps universe key -> column name in {Sector}_index tables.
 # Each sector index table has columns: date, SP500, DOW, NASDAQ
 _SECTOR_INDEX_COLUMN_MAP: dict[str, str] = {
@@ -79,122 +149,381 @@ _SECTOR_INDEX_COLUMN_MAP: dict[str, str] = {
     "dow":    "DOW",
     "nasdaq": "NASDAQ",
 }
+# Returned series keep one point per _SAMPLE_DAYS bucket (the dashboard's
+# 2-week interval); LTTB only kicks in as a cap above _MAX_POINTS points.
+_SAMPLE_DAYS = 14
+_MAX_POINTS  = 200
+
+# Rows per PostgREST request when paging through a table (Supabase's default
+# max-rows cap, so a single unpaged select would silently truncate past it).
+_PAGE_SIZE = 1000
+
+
+# ── Response caches ───────────────────────────────────────────────────────────
+# Graph responses are cached fully built (already sampled and grouped), so a
+# repeat dashboard view skips the Supabase round-trip entirely. Errors are
+# never cached. Tariff probabilities come from core.tariff_probs.
+_GRAPH_TTL_SECONDS = 300
+
+_GRAPH_CACHE: TTLCache = TTLCache(maxsize=256, ttl=_GRAPH_TTL_SECONDS)
+
+
+def _cached(fetcher):
+    """Cache a fetcher's response in _GRAPH_CACHE, keyed on its non-client arguments."""
+    @functools.wraps(fetcher)
+    async def wrapper(*args, **kwargs):
+        key = (
+            fetcher.__name__,
+            *(a for a in args if not isinstance(a, Client)),
+            *sorted((k, v) for k, v in kwargs.items() if not isinstance(v, Client)),
+        )
+        hit = _GRAPH_CACHE.get(key)
+        if hit is not None:
+            return hit
+        result = await fetcher(*args, **kwargs)
+        _GRAPH_CACHE[key] = result
+        return result
+    return wrapper
+
+
+def clear_caches() -> None:
+    """Drop every cached dashboard response (e.g. after re-ingesting data)."""
+    _GRAPH_CACHE.clear()
+    _ENCODED_CACHE.clear()
+    tariff_probs.invalidate()
+
+
+# ── HTTP caching ──────────────────────────────────────────────────────────────
+# /graph and /tariff-prob carry an ETag (hash of the JSON body) and a
+# Cache-Control header; a matching If-None-Match gets an empty 304. The
+# encoded body + ETag are memoised per response object, so a _GRAPH_CACHE
+# hit is neither re-serialised nor re-hashed.
+_CACHE_CONTROL = f"public, max-age={_GRAPH_TTL_SECONDS}, stale-while-revalidate=86400"
+
+# id(response) -> (response, body, etag); the response is held so its id
+# cannot be reused while the entry lives.
+_ENCODED_CACHE: TTLCache = TTLCache(maxsize=512, ttl=_GRAPH_TTL_SECONDS)
+
+
+def _encode(model) -> tuple[bytes, str]:
+    hit = _ENCODED_CACHE.get(id(model))
+    if hit is not None and hit[0] is model:
+        return hit[1], hit[2]
+    body = model.__pydantic_serializer__.to_json(model)
+    etag = f'"{hashlib.blake2s(body, digest_size=16).hexdigest()}"'
+    _ENCODED_CACHE[id(model)] = (model, body, etag)
+    return body, etag
+
+
+def _conditional_response(request: Request, model) -> Response:
+    """JSON response for `model`, or 304 Not Modified if the client's copy is current."""
+    body, etag = _encode(model)
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (t.strip().removeprefix("W/") for t in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 def _normalize_date(raw: object) -> str:
     """Return the first 10 chars of any date value: 'YYYY-MM-DD'."""
-    return str(raw)[:10]
+    # PostgREST already returns dates as str; skip the str() call on the hot path
+    return raw[:10] if type(raw) is str else str(raw)[:10]
+
+
+# Days before the first of each month in a non-leap year.
+_CUMDAYS = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+def _ordinal(iso: str) -> int:
+    """
+    Day number of a 'YYYY-MM-DD' string (matches date.toordinal()).
+
+    Integer arithmetic on the string slices avoids allocating a date object
+    per point, which dominates down-sampling time on long series.
+    """
+    y, m, d = int(iso[:4]), int(iso[5:7]), int(iso[8:10])
+    p = y - 1
+    leap_day = m > 2 and y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)
+    return p * 365 + p // 4 - p // 100 + p // 400 + _CUMDAYS[m - 1] + d + leap_day
+
+
+# date(1970, 1, 1).toordinal(): datetime64[D] counts days from the epoch.
+_EPOCH_ORDINAL = 719163
+
+
+def _ordinals(isos) -> np.ndarray:
+    """
+    Day numbers (as _ordinal) of a sequence of 'YYYY-MM-DD' strings.
+
+    numpy parses the whole column in C, ~20x faster than calling _ordinal
+    per element.
+    """
+    return np.array(isos, dtype="datetime64[D]").astype(np.int64) + _EPOCH_ORDINAL
 
 
-def _sample_every_14_days(points: list[DatePricePoint]) -> list[DatePricePoint]:
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
     """
-    Down-sample a list already sorted by date ascending,
-    keeping one point every >= 14 calendar days.
+    Largest-Triangle-Three-Buckets: indices of `n_out` points that preserve
+    the visual shape of (x, y) — peaks and troughs survive, unlike stride
+    sampling. First and last points are always kept.
     """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    out = np.empty(n_out, dtype=np.intp)
+    if _lttb_inner is not None:
+        _lttb_inner(x, y, n_out, out)
+        return out
+
+    every = (n - 2) / (n_out - 2)
+    out[0], out[-1] = 0, n - 1
+
+    a = 0   # previously selected point
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end   = int((i + 1) * every) + 1
+        nxt   = slice(end, min(int((i + 2) * every) + 1, n))
+        avg_x, avg_y = x[nxt].mean(), y[nxt].mean()
+
+        bx, by = x[start:end], y[start:end]
+        area = np.abs((x[a] - avg_x) * (by - y[a]) - (x[a] - bx) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        out[i + 1] = a
+
+    return out
+
+
+_lttb_inner = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _lttb_inner(x, y, n_out, out):
+        """Scalar-loop LTTB kernel (same bucket math as _lttb), filled into `out`."""
+        n = len(x)
+        every = (n - 2) / (n_out - 2)
+        out[0] = 0
+        out[n_out - 1] = n - 1
+
+        a = 0
+        for i in range(n_out - 2):
+            start = int(i * every) + 1
+            end   = int((i + 1) * every) + 1
+            nxt_end = min(int((i + 2) * every) + 1, n)
+
+            avg_x = 0.0
+            avg_y = 0.0
+            for j in range(end, nxt_end):
+                avg_x += x[j]
+                avg_y += y[j]
+            avg_x /= nxt_end - end
+            avg_y /= nxt_end - end
+
+            best, best_area = start, -1.0
+            for j in range(start, end):
+                area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+                if area > best_area:
+                    best, best_area = j, area
+            a = best
+            out[i + 1] = a
+
+    # Compile (or load from the on-disk cache) at import, not on the first request.
+    _lttb_inner(np.zeros(4), np.zeros(4), 3, np.empty(3, dtype=np.intp))
+
+
+def _biweekly(ords: np.ndarray, origin: Optional[int] = None) -> np.ndarray:
+    """
+    Indices of the first point in each _SAMPLE_DAYS bucket of date-sorted day
+    ordinals, buckets counted from `origin` (default: the first point). For
+    daily data this is day 0, 14, 28, ... — the same rule, and so the same
+    rows, as the mv_*_biweekly views in backend/sql/biweekly_views.sql.
+    """
+    if len(ords) == 0:
+        return np.arange(0)
+    bucket = (ords - (ords[0] if origin is None else origin)) // _SAMPLE_DAYS
+    return np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+
+
+def _sample_idx(
+    ords: np.ndarray, vals: np.ndarray, origin: Optional[int] = None, bucketed: bool = False,
+) -> np.ndarray:
+    """
+    Biweekly indices of a date-sorted series, LTTB-capped at _MAX_POINTS.
+    bucketed=True skips the bucketing for rows read from a biweekly view.
+    """
+    idx = np.arange(len(ords)) if bucketed else _biweekly(ords, origin)
+    if len(idx) > _MAX_POINTS:
+        idx = idx[_lttb(ords[idx].astype(np.float64), vals[idx], _MAX_POINTS)]
+    return idx
+
+
+def _downsample(
+    points: list[DatePricePoint], origin: Optional[_date] = None, bucketed: bool = False,
+) -> list[DatePricePoint]:
+    """Sample a date-sorted series at 2-week intervals (see _sample_idx)."""
     if not points:
-        return []
+        return points
+    x = _ordinals([p.date for p in points])
+    y = np.fromiter((p.price for p in points), dtype=float, count=len(points))
+    start = origin.toordinal() if origin is not None else None
+    return [points[i] for i in _sample_idx(x, y, start, bucketed)]
 
-    result: list[DatePricePoint] = [points[0]]
-    last = _date.fromisoformat(points[0].date)
 
-    for p in points[1:]:
-        current = _date.fromisoformat(p.date)
-        if (current - last).days >= 14:
-            result.append(p)
-            last = current
+def _downsample_pairs(pairs: list[tuple[str, float]]) -> list[tuple[str, float]]:
+    """Sample date-sorted (date, value) pairs at 2-week intervals (see _sample_idx)."""
+    if not pairs:
+        return pairs
+    dates, vals = zip(*pairs)
+    x = _ordinals(dates)
+    y = np.array(vals, dtype=np.float64)
+    return [pairs[i] for i in _sample_idx(x, y)]
+
+
+def _per_date_mean(
+    ords_by_ticker: dict[str, array],
+    vals_by_ticker: dict[str, array],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cross-ticker mean for every date: (sorted day ordinals, means).
+
+    The per-ticker columns are concatenated once and averaged with a single
+    np.unique + np.bincount pass — no per-date Python lists.
+    """
+    if not ords_by_ticker:
+        return np.empty(0, dtype=np.intc), np.empty(0)
 
-    return result
+    ords = np.concatenate([np.frombuffer(a, dtype=np.intc) for a in ords_by_ticker.values()])
+    vals = np.concatenate([np.frombuffer(a, dtype=np.float64) for a in vals_by_ticker.values()])
+    days, inv = np.unique(ords, return_inverse=True)
+    return days, np.bincount(inv, weights=vals) / np.bincount(inv)
 
 
-def _sample_pairs_every_14_days(
-    pairs: list[tuple[str, float]],
-) -> list[tuple[str, float]]:
-    """Down-sample (date, value) pairs, keeping one every >= 14 calendar days."""
+def _columns(rows: list[dict], key: str) -> tuple[np.ndarray, np.ndarray]:
+    """(day ordinals, values) for the non-null `key` of RPC rows sorted by date."""
+    pairs = [(r["date"][:10], float(r[key])) for r in rows if r.get(key) is not None]
     if not pairs:
-        return []
-    result = [pairs[0]]
-    last = _date.fromisoformat(pairs[0][0])
-    for d, v in pairs[1:]:
-        current = _date.fromisoformat(d)
-        if (current - last).days >= 14:
-            result.append((d, v))
-            last = current
-    return result
+        return np.empty(0, dtype=np.intc), np.empty(0)
+    dates, vals = zip(*pairs)
+    return _ordinals(dates).astype(np.intc), np.array(vals, dtype=np.float64)
 
 
-def _sector_to_table_name(sector: str) -> str:
+def _series_points(ords: np.ndarray, vals: np.ndarray) -> list[SeriesPoint]:
+    """Sample a column pair (day ordinals, values) into SeriesPoints (see _sample_idx)."""
+    idx = _sample_idx(ords.astype(np.int64), vals)
+    return [
+        SeriesPoint.model_construct(date=_date.fromordinal(o).isoformat(), value=v)
+        for o, v in zip(ords[idx].tolist(), vals[idx].tolist())
+    ]
+
+
+def _csv_rows(data: object) -> list[list[str]]:
     """
-    Convert a sector display name to the corresponding Supabase top-10 table name.
+    Value rows of a PostgREST `.csv()` response, header dropped.
 
-    Special case:
-      "Steel and aluminum" / "Steel & aluminum"  -> "Steel_aluminum_top10"
+    Columns come back in `select` order, so callers unpack each row as a
+    tuple instead of doing per-column dict lookups. NULL is an empty string.
+    """
+    if not isinstance(data, str):   # empty body -> postgrest-py returns []
+        return []
+    return list(csv.reader(io.StringIO(data)))[1:]
 
-    All other sectors:
-      Capitalise first letter, replace spaces with underscores, append "_top10".
 
-    Examples:
-      "Energy"      -> "Energy_top10"
-      "Agriculture" -> "Agriculture_top10"
+def _pages(make_query, page_size: int = _PAGE_SIZE):
     """
-    if sector.lower() in ("steel and aluminum", "steel & aluminum"):
-        return "Steel_aluminum_top10"
+    Yield a table's rows (as CSV value lists) one PostgREST page at a time.
 
-    cleaned = sector.strip()
-    if not cleaned:
-        raise ValueError("sector must not be empty")
+    `make_query(lo, hi)` must return a query with `.range(lo, hi)` applied.
+    Iteration stops at the first short page, so callers can fold each page
+    into their own structures and drop it instead of holding one huge list.
+    """
+    lo = 0
+    while True:
+        rows = _csv_rows(make_query(lo, lo + page_size - 1).csv().execute().data)
+        if rows:
+            yield rows
+        if len(rows) < page_size:
+            return
+        lo += page_size
 
-    table = cleaned[0].upper() + cleaned[1:]
-    table = table.replace(" ", "_")
-    return f"{table}_top10"
 
+def _rpc_rows(supabase: Client, fn: str, params: dict) -> list[dict] | None:
+    """
+    Call an aggregation RPC. Returns None (caller falls back to computing it
+    in Python) when the function is not installed or the call fails.
+    """
+    try:
+        return supabase.rpc(fn, params).execute().data or None
+    except Exception:
+        return None
 
-def _sector_to_index_table_name(sector: str) -> str:
+
+def _optional_read(read) -> list | None:
     """
-    Convert a sector display name to the corresponding Supabase sector-index table name.
+    Run `read()` against an optional materialized view. Returns None (caller
+    falls back to the full table) when the view is missing or empty.
+    """
+    try:
+        return read() or None
+    except Exception:
+        return None
 
-    Special case:
-      "Steel and aluminum" / "Steel & aluminum"  -> "Steel_aluminum_index"
 
-    All other sectors:
-      Capitalise first letter, replace spaces with underscores, append "_index".
+# Memoised on the raw query value: repeat requests skip the strip/lower.
+# Unknown sectors raise, and lru_cache never stores exceptions, so only the
+# handful of valid spellings occupy the cache.
+@functools.lru_cache(maxsize=64)
+def _sector_table_stem(sector: str) -> str:
+    try:
+        return _SECTOR_TABLE_STEM[sector.strip().lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown sector '{sector}'. "
+            f"Must be one of: {sorted(_SECTOR_TABLE_STEM)}."
+        ) from None
+
+
+def _sector_to_table_name(sector: str) -> str:
+    """
+    Convert a sector display name to the corresponding Supabase top-10 table name.
 
     Examples:
-      "Energy"      -> "Energy_index"
-      "Aerospace"   -> "Aerospace_index"
+      "Energy"            -> "Energy_top10"
+      "Steel & Aluminum"  -> "Steel_aluminum_top10"
     """
-    if sector.lower() in ("steel and aluminum", "steel & aluminum"):
-        return "Steel_aluminum_index"
+    return f"{_sector_table_stem(sector)}_top10"
+
 
-    cleaned = sector.strip()
-    if not cleaned:
-        raise ValueError("sector must not be empty")
+def _sector_to_index_table_name(sector: str) -> str:
+    """
+    Convert a sector display name to the corresponding Supabase sector-index table name.
 
-    table = cleaned[0].upper() + cleaned[1:]
-    table = table.replace(" ", "_")
-    return f"{table}_index"
+    Examples:
+      "Aerospace"           -> "Aerospace_index"
+      "Steel and aluminum"  -> "Steel_aluminum_index"
+    """
+    return f"{_sector_table_stem(sector)}_index"
 
 
 # ── Endpoints ─────────────────────────────────────────────────────────────────
 
 @router.get("/tariff-prob", response_model=TariffProbResponse)
 async def get_tariff_probability(
+    request: Request,
     country: str     = Query(..., description="Country name (e.g. 'CHINA')"),
     sector: str      = Query(..., description="Sector name (e.g. 'Energy')"),
     supabase: Client = Depends(get_supabase),
-) -> TariffProbResponse:
+) -> Response:
     """Return the tariff probability % for a given (country, sector) pair."""
-    resp = (
-        supabase.table("country_tariff_prob")
-        .select("country, sector, tariff_risk_prob")
-        .eq("country", country)
-        .eq("sector", sector)
-        .limit(1)
-        .execute()
-    )
+    table = await tariff_probs.get_table(supabase)
+    prob = next((p for sec, p in table.get(country, ()) if sec == sector), None)
 
-    if not resp.data:
+    if prob is None:
         raise HTTPException(
             status_code=404,
             detail=(
@@ -203,65 +532,176 @@ async def get_tariff_probability(
             ),
         )
 
-    row = resp.data[0]
-    return TariffProbResponse(
-        country=row["country"],
-        sector=row["sector"],
+    return _conditional_response(request, TariffProbResponse(
+        country=country,
+        sector=sector,
         # tariff_risk_prob is stored as 0–1 float; convert to percentage
-        probability_percent=round(float(row["tariff_risk_prob"]) * 100, 2),
-    )
+        probability_percent=round(prob * 100, 2),
+    ))
 
 
-@router.get("/graph")
+@router.get(
+    "/graph",
+    response_model=IndexGraphResponse | SectorTop10Response | SectorTop10ColumnarResponse,
+)
 async def get_graph_data(
-    graph_type: str       = Query(..., description="nasdaq | sp500 | dowjones | top10_sector_stocks"),
-    sector: Optional[str] = Query(None, description="Required when graph_type=top10_sector_stocks"),
-    supabase: Client      = Depends(get_supabase),
-) -> IndexGraphResponse | SectorTop10Response:
+    request: Request,
+    graph_type: _GraphType     = Query(..., description="nasdaq | sp500 | dowjones | top10_sector_stocks"),
+    sector: Optional[str]      = Query(None, description="Required when graph_type=top10_sector_stocks"),
+    graph_format: _GraphFormat = Query("points", alias="format", description="points | columnar (top-10 only)"),
+    since: Optional[_date]     = Query(None, description="Index graphs only: first date to include (YYYY-MM-DD)"),
+    supabase: Client           = Depends(get_supabase),
+) -> Response:
     """
-    Return time-series graph data sampled at 2-week intervals.
+    Return time-series graph data sampled at 2-week intervals (see _sample_idx).
 
     - nasdaq / sp500 / dowjones  -> { graph_type, points: [{date, price}] }
     - top10_sector_stocks        -> { sector, series: [{ticker, points}] }
+      with format=columnar       -> { sector, series: [{ticker, dates, prices, baseline_prices}] }
     """
-    if graph_type not in _VALID_GRAPH_TYPES:
-        raise HTTPException(
-            status_code=400,
-            detail=(
-                f"Invalid graph_type '{graph_type}'. "
-                f"Must be one of: {sorted(_VALID_GRAPH_TYPES)}."
-            ),
-        )
-
     if graph_type == "top10_sector_stocks":
         if not sector:
             raise HTTPException(
                 status_code=400,
                 detail="'sector' query parameter is required when graph_type=top10_sector_stocks.",
             )
-        return await _fetch_sector_top10(sector, supabase)
+        if graph_format == "columnar":
+            result = await _fetch_sector_top10_columnar(sector, supabase)
+        else:
+            result = await _fetch_sector_top10(sector, supabase)
+    else:
+        result = await _fetch_index_series(graph_type, supabase, since)
+
+    return _conditional_response(request, result)
+
+
+@router.get("/bundle", response_model=DashboardBundleResponse)
+async def get_dashboard_bundle(
+    request: Request,
+    country: Optional[str] = Query(None, description="Country name (e.g. 'CHINA')"),
+    sector: Optional[str]  = Query(None, description="Sector name (e.g. 'Energy')"),
+    supabase: Client       = Depends(get_supabase),
+) -> Response:
+    """
+    Batch the dashboard's initial reads. The tariff table and the three
+    index series are fetched concurrently (each through its own cache), so
+    the page pays one round-trip instead of five.
+
+    Each part fails independently, as the separate calls did: an index that
+    errors (e.g. 404, no rows) is left out of `indices`, and a failed tariff
+    table load leaves `sectors` empty and `tariff_prob` null.
+    """
+    table, *indices = await asyncio.gather(
+        tariff_probs.get_table(supabase),
+        *(_fetch_index_series(g, supabase, None) for g in _INDEX_VALUE_MAP),
+        return_exceptions=True,
+    )
+    if isinstance(table, BaseException):
+        table = {}
+    indices = [r for r in indices if not isinstance(r, BaseException)]
+
+    rows = table.get(country, []) if country else []
+    # tariff_risk_prob is stored as 0–1 float; convert to percentage
+    sectors = [
+        SectorProbability.model_construct(sector=sec, probability_percent=round(p * 100, 2))
+        for sec, p in rows
+    ]
+    tariff_prob = next(
+        (
+            TariffProbResponse.model_construct(
+                country=country, sector=s.sector, probability_percent=s.probability_percent,
+            )
+            for s in sectors if s.sector == sector
+        ),
+        None,
+    )
+
+    return _conditional_response(request, DashboardBundleResponse.model_construct(
+        country=country,
+        sector=sector,
+        tariff_prob=tariff_prob,
+        sectors=sectors,
+        indices=indices,
+    ))
+
+
+def _require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Reject the request unless X-Admin-Token matches DASHBOARD_ADMIN_TOKEN."""
+    expected = get_admin_token()
+    if not expected:
+        raise HTTPException(
+            status_code=403,
+            detail="Admin endpoints are disabled: DASHBOARD_ADMIN_TOKEN is not set.",
+        )
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=401, detail="Missing or invalid X-Admin-Token.")
+
 
-    return await _fetch_index_series(graph_type, supabase)
+@router.post("/cache/clear", tags=["meta"], dependencies=[Depends(_require_admin)])
+async def clear_dashboard_cache(supabase: Client = Depends(get_supabase)) -> dict:
+    """Refresh the biweekly views and invalidate cached responses after new data is ingested."""
+    try:
+        await run_in_threadpool(lambda: supabase.rpc("refresh_dashboard_views").execute())
+        views_refreshed = True
+    except Exception:   # views not installed — nothing to refresh
+        views_refreshed = False
+    clear_caches()
+    return {"status": "cleared", "views_refreshed": views_refreshed}
 
 
 # ── Private fetchers ──────────────────────────────────────────────────────────
 
-async def _fetch_index_series(graph_type: str, supabase: Client) -> IndexGraphResponse:
+@_cached
+async def _fetch_index_series(
+    graph_type: str, supabase: Client, since: Optional[_date] = None,
+) -> IndexGraphResponse:
     """
-    Query Index_paths (long format) filtered by the `index` column.
-    Returns impacted_price sampled every 14 days.
+    Query Index_paths (long format) filtered by the `index` column, and by
+    date >= `since` in Postgres when given.
+    Returns impacted_price sampled at 2-week intervals.
+
+    mv_index_paths_biweekly is read when installed; otherwise the full table
+    is bucketed here with the view's rule (buckets counted from the series'
+    first date, not from `since`), so both paths return the same rows.
     """
     index_value = _INDEX_VALUE_MAP[graph_type]
 
-    resp = (
-        supabase.table("Index_paths")
-        .select("date, impacted_price")
-        .eq("index", index_value)
-        .order("date", desc=False)
-        .execute()
-    )
+    def query(table: str, start: Optional[_date]):
+        q = supabase.table(table).select("date, impacted_price").eq("index", index_value)
+        if start is not None:
+            q = q.gte("date", start.isoformat())
+        return q.order("date", desc=False)
+
+    def read() -> tuple[list[dict], Optional[_date], bool]:
+        """(rows, bucket origin, rows already bucketed by the view)"""
+        # Prefer the pre-thinned view; it ships ~1/14th of the rows.
+        rows = _optional_read(lambda: query("mv_index_paths_biweekly", since).execute().data)
+        if rows is not None:
+            return rows, None, True
+        if since is None:
+            return query("Index_paths", None).execute().data, None, False
+
+        # Buckets are anchored on the series' first date, so fetch from the
+        # start of the bucket holding `since`; rows before `since` are
+        # dropped after bucketing.
+        first = (
+            supabase.table("Index_paths").select("date")
+            .eq("index", index_value)
+            .not_.is_("impacted_price", "null")
+            .order("date", desc=False)
+            .limit(1)
+            .execute()
+        ).data
+        if not first:
+            return [], None, False
+        origin = _date.fromisoformat(_normalize_date(first[0]["date"]))
+        offset = max((since - origin).days, 0)
+        start  = origin + timedelta(days=offset - offset % _SAMPLE_DAYS)
+        return query("Index_paths", start).execute().data, origin, False
+
+    rows, origin, bucketed = await run_in_threadpool(read)
 
-    if not resp.data:
+    if not rows:
         raise HTTPException(
             status_code=404,
             detail=(
@@ -271,13 +711,14 @@ async def _fetch_index_series(graph_type: str, supabase: Client) -> IndexGraphRe
         )
 
     raw_points: list[DatePricePoint] = []
-    for row in resp.data:
+    for row in rows:
         raw_date = row.get("date")
         price_val = row.get("impacted_price")
         if raw_date is None or price_val is None:
             continue
+        # model_construct skips validation: fields are already float()/_normalize_date()
         raw_points.append(
-            DatePricePoint(date=_normalize_date(raw_date), price=float(price_val))
+            DatePricePoint.model_construct(date=_normalize_date(raw_date), price=float(price_val))
         )
 
     if not raw_points:
@@ -286,88 +727,119 @@ async def _fetch_index_series(graph_type: str, supabase: Client) -> IndexGraphRe
             detail=f"All rows for index='{index_value}' have null impacted_price.",
         )
 
-    return IndexGraphResponse(
-        graph_type=graph_type,
-        points=_sample_every_14_days(raw_points),
-    )
+    points = _downsample(raw_points, origin, bucketed)
+    if since is not None and not bucketed:
+        first_day = since.isoformat()
+        points = [p for p in points if p.date >= first_day]
+
+    return IndexGraphResponse.model_construct(graph_type=graph_type, points=points)
 
 
+@_cached
 async def _fetch_sector_top10(sector: str, supabase: Client) -> SectorTop10Response:
     """
     Query a sector's top-10 table (long format: one row per ticker per date).
-    Groups rows by ticker, returns impacted_price sampled every 14 days.
+    Groups rows by ticker, returns impacted_price sampled at 2-week intervals per ticker.
     """
     try:
         table_name = _sector_to_table_name(sector)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
-    try:
-        resp = (
-            supabase.table(table_name)
-            .select("date, ticker, baseline_price, impacted_price")
-            .order("date", desc=False)
-            .execute()
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=404,
-            detail=(
-                f"Could not query table '{table_name}' for sector='{sector}'. "
-                f"Verify the table exists in Supabase. Error: {exc}"
-            ),
-        )
-
-    if not resp.data:
+    def read_all(table: str) -> list[list[str]]:
+        # Paged: one unpaged read stops at Supabase's max-rows cap, and with
+        # this (ticker, date) order that would drop whole tickers.
+        return [
+            row
+            for page in _pages(
+                lambda lo, hi: supabase.table(table)
+                .select("date, ticker, baseline_price, impacted_price")
+                .order("ticker")
+                .order("date")
+                .range(lo, hi)
+            )
+            for row in page
+        ]
+
+    def read() -> tuple[list[list[str]], bool]:
+        """(rows, rows already bucketed by the view)"""
+        rows = _optional_read(lambda: read_all(f"mv_{table_name.lower()}_biweekly"))
+        if rows is None:
+            try:
+                rows = read_all(table_name)
+            except Exception as exc:
+                raise HTTPException(
+                    status_code=404,
+                    detail=(
+                        f"Could not query table '{table_name}' for sector='{sector}'. "
+                        f"Verify the table exists in Supabase. Error: {exc}"
+                    ),
+                )
+            return rows, False
+        return rows, True
+
+    rows, bucketed = await run_in_threadpool(read)
+
+    if not rows:
         raise HTTPException(
             status_code=404,
             detail=f"Table '{table_name}' exists but contains no rows.",
         )
 
-    # Group rows by ticker -> sorted list of DatePricePoints
-    ticker_map: dict[str, list[DatePricePoint]] = defaultdict(list)
-    for row in resp.data:
-        raw_date     = row.get("date")
-        ticker       = row.get("ticker")
-        impacted_val = row.get("impacted_price")
-        baseline_val = row.get("baseline_price")
-
-        if raw_date is None or ticker is None:
-            continue
-
-        # impacted_price is required for this endpoint
-        if impacted_val is None:
-            continue
-
-        ticker_map[ticker].append(
-            DatePricePoint(
-                date=_normalize_date(raw_date),
+    # Rows arrive ordered by (ticker, date): one run per ticker, one pass.
+    # impacted_price is required for this endpoint. Without the view, each
+    # ticker is bucketed from its own first date, as the view does.
+    series: list[TickerSeries] = []
+    for ticker, group in groupby(rows, key=itemgetter(1)):
+        pts = [
+            DatePricePoint.model_construct(
+                date=raw_date[:10],
                 price=float(impacted_val),
-                baseline_price=float(baseline_val) if baseline_val is not None else None,
+                baseline_price=float(baseline_val) if baseline_val else None,
             )
-        )
-
-    if not ticker_map:
+            for raw_date, _, baseline_val, impacted_val in group
+            if raw_date and impacted_val
+        ]
+        if ticker and pts:
+            series.append(TickerSeries.model_construct(
+                ticker=ticker, points=_downsample(pts, bucketed=bucketed),
+            ))
+
+    if not series:
         raise HTTPException(
             status_code=404,
             detail=f"No valid (date, ticker, impacted_price) rows found in '{table_name}'.",
         )
 
-    # Down-sample each ticker's series independently
-    series: list[TickerSeries] = [
-        TickerSeries(ticker=ticker, points=_sample_every_14_days(pts))
-        for ticker, pts in sorted(ticker_map.items())
-        if pts
-    ]
+    return SectorTop10Response.model_construct(sector=sector, series=series)
 
-    return SectorTop10Response(sector=sector, series=series)
+
+@_cached
+async def _fetch_sector_top10_columnar(sector: str, supabase: Client) -> SectorTop10ColumnarResponse:
+    """
+    Same series as _fetch_sector_top10, transposed to parallel arrays per
+    ticker — the per-point key names drop out of the JSON.
+    """
+    top10 = await _fetch_sector_top10(sector, supabase)
+    return SectorTop10ColumnarResponse.model_construct(
+        sector=top10.sector,
+        series=[
+            TickerColumns.model_construct(
+                ticker=s.ticker,
+                dates=[p.date for p in s.points],
+                prices=[p.price for p in s.points],
+                baseline_prices=[p.baseline_price for p in s.points],
+            )
+            for s in top10.series
+        ],
+    )
 
 
 # ── /chart-data endpoint ───────────────────────────────────────────────────────
 
 @router.get("/chart-data", response_model=ChartDataResponse)
 async def get_chart_data(
-    universe: str         = Query(..., description="sp500 | dow | nasdaq | sector_top10"),
+    universe: _Universe   = Query(..., description="sp500 | dow | nasdaq | sector_top10"),
     sector: Optional[str] = Query(None, description="Required when universe=sector_top10"),
     supabase: Client      = Depends(get_supabase),
 ) -> ChartDataResponse:
@@ -377,15 +849,6 @@ async def get_chart_data(
     - sp500 / dow / nasdaq  -> two series: baseline + tariff-adjusted index prices
     - sector_top10          -> sector avg baseline, sector avg adjusted, + one series per ticker
     """
-    if universe not in _VALID_UNIVERSES:
-        raise HTTPException(
-            status_code=400,
-            detail=(
-                f"Invalid universe '{universe}'. "
-                f"Must be one of: {sorted(_VALID_UNIVERSES)}."
-            ),
-        )
-
     if universe == "sector_top10":
         if not sector:
             raise HTTPException(
@@ -400,6 +863,7 @@ async def get_chart_data(
     return await _fetch_index_chart_data(universe, supabase, sector=sector)
 
 
+@_cached
 async def _fetch_index_chart_data(
     universe: str,
     supabase: Client,
@@ -431,34 +895,43 @@ async def _fetch_index_chart_data(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
+    # Both reads are independent; run them in worker threads side by side.
+
     # ── 1. Baseline from index_baseline ───────────────────────────────────────
-    try:
-        baseline_resp = (
-            supabase.table("index_baseline")
-            .select("date, baseline_price")
-            .eq("index", index_value)
-            .order("date", desc=False)
-            .execute()
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Could not query index_baseline for universe='{universe}'. Error: {exc}",
-        )
+    def read_baseline():
+        try:
+            return (
+                supabase.table("index_baseline")
+                .select("date, baseline_price")
+                .eq("index", index_value)
+                .order("date", desc=False)
+                .execute()
+            )
+        except Exception as exc:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Could not query index_baseline for universe='{universe}'. Error: {exc}",
+            )
 
     # ── 2. Sector-adjusted from {Sector}_index ────────────────────────────────
-    try:
-        sector_resp = (
-            supabase.table(table_name)
-            .select(f"date, {col}")
-            .order("date", desc=False)
-            .execute()
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Could not query '{table_name}' for universe='{universe}'. Error: {exc}",
-        )
+    def read_sector():
+        try:
+            return (
+                supabase.table(table_name)
+                .select(f"date, {col}")
+                .order("date", desc=False)
+                .execute()
+            )
+        except Exception as exc:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Could not query '{table_name}' for universe='{universe}'. Error: {exc}",
+            )
+
+    baseline_resp, sector_resp = await asyncio.gather(
+        run_in_threadpool(read_baseline),
+        run_in_threadpool(read_sector),
+    )
 
     if not sector_resp.data:
         raise HTTPException(
@@ -479,13 +952,13 @@ async def _fetch_index_chart_data(
         baseline_raw.append((_normalize_date(raw_date), float(val)))
 
     if baseline_raw:
-        series.append(ChartSeries(
+        series.append(ChartSeries.model_construct(
             key="baseline",
             label="Baseline (no tariff)",
             kind="baseline",
             points=[
-                SeriesPoint(date=d, value=v)
-                for d, v in _sample_pairs_every_14_days(baseline_raw)
+                SeriesPoint.model_construct(date=d, value=v)
+                for d, v in _downsample_pairs(baseline_raw)
             ],
         ))
 
@@ -504,22 +977,23 @@ async def _fetch_index_chart_data(
             detail=f"All rows in '{table_name}' have null '{col}'.",
         )
 
-    series.append(ChartSeries(
+    series.append(ChartSeries.model_construct(
         key="adjusted",
         label=f"{sector} — {col}",
         kind="adjusted",
         points=[
-            SeriesPoint(date=d, value=v)
-            for d, v in _sample_pairs_every_14_days(adjusted_raw)
+            SeriesPoint.model_construct(date=d, value=v)
+            for d, v in _downsample_pairs(adjusted_raw)
         ],
     ))
 
-    return ChartDataResponse(universe=universe, sector=sector, series=series)
+    return ChartDataResponse.model_construct(universe=universe, sector=sector, series=series)
 
 
+@_cached
 async def _fetch_sector_chart_data(sector: str, supabase: Client) -> ChartDataResponse:
     """
-    Return per-ticker series + sector-average baseline/adjusted, sampled every 14 days.
+    Return per-ticker series + sector-average baseline/adjusted, sampled at 2-week intervals.
 
     - Individual stock series = impacted_price ONLY
     - Sector avg baseline     = baseline_price
@@ -530,55 +1004,75 @@ async def _fetch_sector_chart_data(sector: str, supabase: Client) -> ChartDataRe
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
-    try:
-        resp = (
-            supabase.table(table_name)
+    # ─────────────────────────────────────────────
+    # Stream pages and group by ticker as they arrive. supabase-py is sync,
+    # so this and the sector-average RPC each run in a worker thread and
+    # overlap instead of paying two round-trips back to back.
+    # ─────────────────────────────────────────────
+
+    def read_tickers():
+        # Column-wise (SoA) per ticker: day ordinals + values in typed arrays,
+        # no per-point tuple. Baseline feeds only the sector average.
+        adj_ords:  dict[str, array] = defaultdict(functools.partial(array, "i"))
+        adj_vals:  dict[str, array] = defaultdict(functools.partial(array, "d"))
+        base_ords: dict[str, array] = defaultdict(functools.partial(array, "i"))
+        base_vals: dict[str, array] = defaultdict(functools.partial(array, "d"))
+
+        pages = _pages(
+            lambda lo, hi: supabase.table(table_name)
             .select("date, ticker, baseline_price, impacted_price")
             .order("date", desc=False)
-            .execute()
-        )
-    except Exception as exc:
-        raise HTTPException(
-            status_code=404,
-            detail=(
-                f"Could not query table '{table_name}' for sector='{sector}'. "
-                f"Error: {exc}"
-            ),
+            .order("ticker", desc=False)   # stable order across page boundaries
+            .range(lo, hi)
         )
+        n_rows = 0
+        while True:
+            try:
+                page = next(pages, None)
+            except Exception as exc:
+                raise HTTPException(
+                    status_code=404,
+                    detail=(
+                        f"Could not query table '{table_name}' for sector='{sector}'. "
+                        f"Error: {exc}"
+                    ),
+                )
+            if page is None:
+                break
+            n_rows += len(page)
+
+            for raw_date, ticker, baseline, impacted in page:
+                if not raw_date or not ticker:
+                    continue
+
+                day = _ordinal(raw_date)
+
+                # ✅ STOCK LINES: impacted_price ONLY
+                if impacted:
+                    adj_ords[ticker].append(day)
+                    adj_vals[ticker].append(float(impacted))
+
+                # Baseline is used ONLY for sector baseline average
+                if baseline:
+                    base_ords[ticker].append(day)
+                    base_vals[ticker].append(float(baseline))
+
+        return n_rows, (base_ords, base_vals), (adj_ords, adj_vals)
+
+    avg_rows, (n_rows, ticker_baseline, ticker_adjusted) = await asyncio.gather(
+        # Sector averages aggregated in Postgres (one row per date), if installed
+        run_in_threadpool(_rpc_rows, supabase, "sector_daily_avg", {"tbl": table_name}),
+        run_in_threadpool(read_tickers),
+    )
 
-    if not resp.data:
+    if not n_rows:
         raise HTTPException(
             status_code=404,
             detail=f"Table '{table_name}' exists but contains no rows.",
         )
 
-    # ─────────────────────────────────────────────
-    # Group by ticker
-    # ─────────────────────────────────────────────
-
-    ticker_baseline: dict[str, list[tuple[str, float]]] = defaultdict(list)
-    ticker_adjusted: dict[str, list[tuple[str, float]]] = defaultdict(list)
-
-    for row in resp.data:
-        raw_date = row.get("date")
-        ticker   = row.get("ticker")
-
-        if raw_date is None or ticker is None:
-            continue
-
-        date_str = _normalize_date(raw_date)
-
-        # ✅ STOCK LINES: impacted_price ONLY
-        impacted = row.get("impacted_price")
-        if impacted is not None:
-            ticker_adjusted[ticker].append((date_str, float(impacted)))
-
-        # Baseline is used ONLY for sector baseline average
-        baseline = row.get("baseline_price")
-        if baseline is not None:
-            ticker_baseline[ticker].append((date_str, float(baseline)))
-
-    if not ticker_adjusted:
+    adj_ords, adj_vals = ticker_adjusted
+    if not adj_ords:
         raise HTTPException(
             status_code=404,
             detail=f"No valid impacted_price rows found in '{table_name}'.",
@@ -588,26 +1082,12 @@ async def _fetch_sector_chart_data(sector: str, supabase: Client) -> ChartDataRe
     # Compute per-date sector averages
     # ─────────────────────────────────────────────
 
-    date_baseline_vals: dict[str, list[float]] = defaultdict(list)
-    date_adjusted_vals: dict[str, list[float]] = defaultdict(list)
-
-    for pairs in ticker_baseline.values():
-        for d, v in pairs:
-            date_baseline_vals[d].append(v)
-
-    for pairs in ticker_adjusted.values():
-        for d, v in pairs:
-            date_adjusted_vals[d].append(v)
-
-    avg_baseline_raw = sorted(
-        [(d, sum(vals) / len(vals)) for d, vals in date_baseline_vals.items()],
-        key=lambda x: x[0],
-    )
-
-    avg_adjusted_raw = sorted(
-        [(d, sum(vals) / len(vals)) for d, vals in date_adjusted_vals.items()],
-        key=lambda x: x[0],
-    )
+    if avg_rows is not None:
+        avg_baseline = _columns(avg_rows, "avg_baseline")
+        avg_adjusted = _columns(avg_rows, "avg_adjusted")
+    else:
+        avg_baseline = _per_date_mean(*ticker_baseline)
+        avg_adjusted = _per_date_mean(adj_ords, adj_vals)
 
     # ─────────────────────────────────────────────
     # Build ChartSeries
@@ -616,43 +1096,36 @@ async def _fetch_sector_chart_data(sector: str, supabase: Client) -> ChartDataRe
     series: list[ChartSeries] = []
 
     # Sector baseline average (thin dashed gray line in frontend)
-    if avg_baseline_raw:
-        series.append(ChartSeries(
+    if len(avg_baseline[0]):
+        series.append(ChartSeries.model_construct(
             key="sector_avg_baseline",
             label="Sector avg (baseline)",
             kind="sector_avg_baseline",
-            points=[
-                SeriesPoint(date=d, value=v)
-                for d, v in _sample_pairs_every_14_days(avg_baseline_raw)
-            ],
+            points=_series_points(*avg_baseline),
         ))
 
     # Sector adjusted average (bold white line in frontend)
-    if avg_adjusted_raw:
-        series.append(ChartSeries(
+    if len(avg_adjusted[0]):
+        series.append(ChartSeries.model_construct(
             key="sector_avg_adjusted",
             label="Sector avg (tariff-adjusted)",
             kind="sector_avg_adjusted",
-            points=[
-                SeriesPoint(date=d, value=v)
-                for d, v in _sample_pairs_every_14_days(avg_adjusted_raw)
-            ],
+            points=_series_points(*avg_adjusted),
         ))
 
     # Individual stock series (10 colored lines) — impacted only
-    for ticker in sorted(ticker_adjusted.keys()):
-        sampled = _sample_pairs_every_14_days(ticker_adjusted[ticker])
-        series.append(ChartSeries(
+    for ticker in sorted(adj_ords):
+        series.append(ChartSeries.model_construct(
             key=f"stock_{ticker}",
             label=ticker,
             kind="stock",
-            points=[
-                SeriesPoint(date=d, value=v)
-                for d, v in sampled
-            ],
+            points=_series_points(
+                np.frombuffer(adj_ords[ticker], dtype=np.intc),
+                np.array(adj_vals[ticker], dtype=np.float64),
+            ),
         ))
 
-    return ChartDataResponse(
+    return ChartDataResponse.model_construct(
         universe="sector_top10",
         sector=sector,
         series=series,
@@ -5,12 +5,14 @@ Endpoints
 ---------
 GET /api/map/country-sectors?country=...
     Returns all sectors and their tariff probabilities for a given country.
-    Source table: country_tariff_prob
+    Source table: country_tariff_prob, via the in-memory copy in
+    core/tariff_probs.py
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from supabase import Client
 
+from ..core import tariff_probs
 from ..core.supabase import get_supabase
 from ..models.responses import CountrySectorsResponse, SectorProbability
 
@@ -27,15 +29,9 @@ async def get_country_sectors(
 
     Results are sorted alphabetically by sector.
     """
-    resp = (
-        supabase.table("country_tariff_prob")
-        .select("sector, tariff_risk_prob")
-        .eq("country", country)
-        .order("sector", desc=False)
-        .execute()
-    )
-
-    if not resp.data:
+    rows = (await tariff_probs.get_table(supabase)).get(country)
+
+    if not rows:
         raise HTTPException(
             status_code=404,
             detail=(
@@ -46,11 +42,11 @@ async def get_country_sectors(
 
     sectors = [
         SectorProbability(
-            sector=row["sector"],
+            sector=sector,
             # tariff_risk_prob is stored as 0–1 float; convert to percentage
-            probability_percent=round(float(row["tariff_risk_prob"]) * 100, 2),
+            probability_percent=round(prob * 100, 2),
         )
-        for row in resp.data
+        for sector, prob in rows
     ]
 
     return CountrySectorsResponse(country=country, sectors=sectors)
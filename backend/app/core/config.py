@@ -10,11 +10,15 @@ Env-var lookup order (first non-empty value wins):
   SUPABASE_ANON_KEY
   NEXT_PUBLIC_SUPABASE_ANON_KEY   ← fallback to frontend key
 
+  DASHBOARD_ADMIN_TOKEN           ← required by POST /api/dashboard/cache/clear
+                                    (unset = endpoint disabled)
+
 Both .env.local and .env are loaded from the project root so the same
 credentials file the frontend uses works here too.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -28,6 +32,9 @@ for _env_name in (".env.local", ".env"):
         load_dotenv(_env_path, override=False)
 
 
+# Env vars are fixed once the files above are loaded, so each lookup runs
+# once per process; a missing value still raises (exceptions are not cached).
+@lru_cache(maxsize=1)
 def get_supabase_url() -> str:
     url = os.getenv("SUPABASE_URL") or os.getenv("NEXT_PUBLIC_SUPABASE_URL", "")
     if not url:
@@ -38,6 +45,7 @@ def get_supabase_url() -> str:
     return url
 
 
+@lru_cache(maxsize=1)
 def get_supabase_key() -> str:
     key = (
         os.getenv("SUPABASE_SERVICE_ROLE_KEY")
@@ -51,3 +59,9 @@ def get_supabase_key() -> str:
             "or NEXT_PUBLIC_SUPABASE_ANON_KEY in .env or .env.local."
         )
     return key
+
+
+@lru_cache(maxsize=1)
+def get_admin_token() -> str:
+    """Shared secret for admin-only endpoints; empty when not configured."""
+    return os.getenv("DASHBOARD_ADMIN_TOKEN", "")
@@ -0,0 +1,101 @@
+"""
+Semantic response cache for the chatbot.
+
+Messages are embedded with a small sentence-transformers model and matched
+against previous messages with a FAISS inner-product index (embeddings are
+L2-normalised, so the score is cosine similarity). A hit above the threshold
+returns the stored response instead of paying for another Cortex call.
+
+Entries are scoped to a hash of the tariff context they were answered with;
+when the context changes the index is rebuilt from scratch.
+
+sentence-transformers and faiss are optional: if either is missing the cache
+stays disabled and every lookup misses.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+_DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class SemanticCache:
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 1024,
+        model_name: str = _DEFAULT_MODEL,
+    ) -> None:
+        self._threshold   = threshold
+        self._ttl         = ttl_seconds
+        self._max_entries = max_entries
+        self._model_name  = model_name
+
+        self._lock      = threading.Lock()
+        self._model     = None
+        self._faiss     = None
+        self._index     = None
+        self._responses: list[str]   = []
+        self._stored_at: list[float] = []
+        self._ctx_hash: str | None   = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._model is not None
+
+    def load(self) -> bool:
+        """
+        Load the embedding model (blocking, ~90 MB). Returns whether the cache
+        is usable; any failure (packages missing, model download or load
+        error) leaves it disabled instead of raising.
+        """
+        if self._model is not None:
+            return True
+        try:
+            import faiss
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer(self._model_name)
+        except Exception:
+            return False
+        self._faiss = faiss
+        self._model = model
+        return True
+
+    def _reset(self, ctx_hash: str) -> None:
+        dim = self._model.get_sentence_embedding_dimension()
+        self._index     = self._faiss.IndexFlatIP(dim)
+        self._responses = []
+        self._stored_at = []
+        self._ctx_hash  = ctx_hash
+
+    def _embed(self, message: str):
+        return self._model.encode([message], normalize_embeddings=True)
+
+    def lookup(self, message: str, ctx_hash: str) -> str | None:
+        if not self.enabled:
+            return None
+        emb = self._embed(message)
+        with self._lock:
+            if self._ctx_hash != ctx_hash or self._index.ntotal == 0:
+                return None
+            D, I = self._index.search(emb, 1)
+            score, idx = float(D[0][0]), int(I[0][0])
+            if score < self._threshold:
+                return None
+            if time.monotonic() - self._stored_at[idx] > self._ttl:
+                return None
+            return self._responses[idx]
+
+    def store(self, message: str, ctx_hash: str, response: str) -> None:
+        if not self.enabled:
+            return
+        emb = self._embed(message)
+        with self._lock:
+            if self._ctx_hash != ctx_hash or len(self._responses) >= self._max_entries:
+                self._reset(ctx_hash)
+            self._index.add(emb)
+            self._responses.append(response)
+            self._stored_at.append(time.monotonic())
@@ -1,17 +1,38 @@
 """
 Module-level singleton for the Supabase client.
 
-FastAPI endpoints obtain it via Depends(get_supabase).
+FastAPI endpoints obtain it via Depends(get_supabase). The client is built
+once per process on top of a shared, keep-alive httpx connection pool, so
+requests reuse open TLS connections instead of paying a handshake each time.
+main.py builds it at startup and closes the pool on shutdown.
 """
 
+from functools import lru_cache
+
+import httpx
 from supabase import create_client, Client
+from supabase.lib.client_options import SyncClientOptions
+
 from .config import get_supabase_url, get_supabase_key
 
-_client: Client | None = None
+_HTTP_LIMITS  = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+_HTTP_TIMEOUT = 120   # seconds — same as supabase-py's default PostgREST timeout
+
+_http_client: httpx.Client | None = None
 
 
+@lru_cache(maxsize=1)
 def get_supabase() -> Client:
-    global _client
-    if _client is None:
-        _client = create_client(get_supabase_url(), get_supabase_key())
-    return _client
+    global _http_client
+    url, key = get_supabase_url(), get_supabase_key()
+    _http_client = httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+    return create_client(url, key, options=SyncClientOptions(httpx_client=_http_client))
+
+
+def close_supabase() -> None:
+    """Close the shared connection pool; the next get_supabase() builds a new one."""
+    global _http_client
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
+    get_supabase.cache_clear()
@@ -0,0 +1,64 @@
+"""
+In-process snapshot of the country_tariff_prob table.
+
+The table is small (countries x ~10 sectors) and only changes when the
+pipeline re-exports it, so /api/dashboard/tariff-prob and
+/api/map/country-sectors both answer from one in-memory copy instead of a
+Supabase round-trip per request. The copy is loaded at startup, reloaded
+once it is older than _TTL_SECONDS, and dropped by invalidate().
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from fastapi.concurrency import run_in_threadpool
+from supabase import Client
+
+_TTL_SECONDS = 300
+_PAGE_SIZE   = 1000   # Supabase's default max-rows cap
+
+# country -> [(sector, tariff_risk_prob 0–1), ...] in sector order
+_snapshot: dict[str, list[tuple[str, float]]] | None = None
+_loaded_at = 0.0
+_lock = asyncio.Lock()
+
+
+def _load(supabase: Client) -> dict[str, list[tuple[str, float]]]:
+    table: dict[str, list[tuple[str, float]]] = {}
+    lo = 0
+    while True:
+        rows = (
+            supabase.table("country_tariff_prob")
+            .select("country, sector, tariff_risk_prob")
+            .order("country")
+            .order("sector")
+            .range(lo, lo + _PAGE_SIZE - 1)
+            .execute()
+        ).data
+        for row in rows:
+            table.setdefault(row["country"], []).append(
+                (row["sector"], float(row["tariff_risk_prob"]))
+            )
+        if len(rows) < _PAGE_SIZE:
+            return table
+        lo += _PAGE_SIZE
+
+
+async def get_table(supabase: Client) -> dict[str, list[tuple[str, float]]]:
+    """Return the cached table, reloading it (off the event loop) when stale."""
+    global _snapshot, _loaded_at
+    if _snapshot is not None and time.monotonic() - _loaded_at < _TTL_SECONDS:
+        return _snapshot
+    async with _lock:
+        if _snapshot is None or time.monotonic() - _loaded_at >= _TTL_SECONDS:
+            _snapshot = await run_in_threadpool(_load, supabase)
+            _loaded_at = time.monotonic()
+    return _snapshot
+
+
+def invalidate() -> None:
+    """Force the next get_table() to reload from Supabase."""
+    global _snapshot
+    _snapshot = None
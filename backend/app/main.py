@@ -6,12 +6,18 @@ Run from the project root (Hacklytics_2026/):
 
 Or from inside backend/:
     python -m uvicorn app.main:app --reload --port 8000
+
+uvicorn[standard] installs uvloop, which uvicorn picks automatically
+(pass --loop uvloop to require it).
 """
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api import dashboard, map as map_router, chatbot
+from .core import tariff_probs
+from .core.supabase import close_supabase, get_supabase
 
 app = FastAPI(
     title="Hacklytics 2026 — Tariff Impact API",
@@ -38,6 +44,42 @@ app.include_router(map_router.router)
 app.include_router(chatbot.router)
 
 
+# ── Lifecycle ─────────────────────────────────────────────────────────────────
+# supabase-py is blocking; the dashboard/map routers run each query in an
+# anyio worker thread, so this caps how many can be in flight at once.
+_WORKER_THREADS = 64
+
+
+@app.on_event("startup")
+async def _startup() -> None:
+    anyio.to_thread.current_default_thread_limiter().total_tokens = _WORKER_THREADS
+    try:
+        await tariff_probs.get_table(get_supabase())
+    except Exception as exc:
+        # Not fatal: the dashboard/map dependencies retry on the first request.
+        print(f"[API] WARNING: could not preload country_tariff_prob: {exc}")
+    try:
+        await chatbot.open_pool()
+    except Exception as exc:
+        # Not fatal: the pool fills lazily on the first /chat request.
+        print(f"[API] WARNING: could not pre-warm Snowflake pool: {exc}")
+    try:
+        if not await chatbot.load_semantic_cache():
+            print(
+                "[API] sentence-transformers/faiss missing or embedding model failed to load"
+                " — chatbot semantic cache disabled."
+            )
+    except Exception as exc:
+        # Not fatal: /chat works without the semantic cache.
+        print(f"[API] WARNING: could not load chatbot semantic cache: {exc}")
+
+
+@app.on_event("shutdown")
+async def _shutdown() -> None:
+    await chatbot.close_pool()
+    close_supabase()
+
+
 # ── Health check ──────────────────────────────────────────────────────────────
 @app.get("/health", tags=["meta"])
 async def health() -> dict:
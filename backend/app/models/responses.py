@@ -38,6 +38,21 @@ class SectorTop10Response(BaseModel):
     series: list[TickerSeries]   # one entry per stock / ticker
 
 
+# Columnar variant (/graph?format=columnar): parallel arrays per ticker
+# instead of one {date, price, baseline_price} object per point.
+
+class TickerColumns(BaseModel):
+    ticker: str
+    dates: list[str]                       # "YYYY-MM-DD"
+    prices: list[float]
+    baseline_prices: list[float | None]
+
+
+class SectorTop10ColumnarResponse(BaseModel):
+    sector: str
+    series: list[TickerColumns]
+
+
 # ── Map page ─────────────────────────────────────────────────────────────────
 
 class SectorProbability(BaseModel):
@@ -68,3 +83,13 @@ class ChartDataResponse(BaseModel):
     universe: str
     sector: str | None = None
     series: list[ChartSeries]
+
+
+# ── Dashboard: one-shot page bundle ──────────────────────────────────────────
+
+class DashboardBundleResponse(BaseModel):
+    country: str | None = None
+    sector: str | None = None
+    tariff_prob: TariffProbResponse | None = None   # needs country + sector
+    sectors: list[SectorProbability]                # all sectors for country
+    indices: list[IndexGraphResponse]               # nasdaq, sp500, dowjones
@@ -0,0 +1,86 @@
+-- Pre-thinned dashboard series, stored as materialized views.
+--
+-- Run once in the Supabase SQL editor. The /graph endpoint reads these views
+-- and falls back to the full tables when they do not exist. After loading
+-- new data, call POST /api/dashboard/cache/clear (with the X-Admin-Token
+-- header set to DASHBOARD_ADMIN_TOKEN) — it runs
+-- refresh_dashboard_views() and then drops the API's in-memory caches.
+--
+-- Rows are grouped into 14-day buckets counted from the first date of each
+-- series; the earliest row of each bucket is kept. Without the views the
+-- API applies the same rule to the full tables (_biweekly in
+-- app/api/dashboard.py), so keep the two in step.
+
+-- Index_paths (long format) → one row per index per 14-day bucket.
+create materialized view if not exists mv_index_paths_biweekly as
+  select distinct on (p.index, (p.date::date - m.min_date) / 14)
+         p.index, p.date::date as date,
+         p.baseline_price::float8 as baseline_price,
+         p.impacted_price::float8 as impacted_price
+    from "Index_paths" p
+    join (select index, min(date::date) as min_date
+            from "Index_paths"
+           where impacted_price is not null
+           group by index) m using (index)
+   where p.impacted_price is not null
+   order by p.index, (p.date::date - m.min_date) / 14, p.date::date;
+
+create unique index if not exists mv_index_paths_biweekly_key
+    on mv_index_paths_biweekly (index, date);
+
+-- {Sector}_top10 (long format) → mv_{sector}_top10_biweekly, one row per
+-- ticker per 14-day bucket. Created for every sector table that exists.
+do $$
+declare
+  src text;
+  mv  text;
+begin
+  foreach src in array array[
+    'Aerospace_top10', 'Agriculture_top10', 'Automotive_top10', 'Energy_top10',
+    'Lumber_top10', 'Maritime_top10', 'Metals_top10', 'Minerals_top10',
+    'Pharmaceuticals_top10', 'Steel_aluminum_top10'
+  ] loop
+    continue when to_regclass(format('%I', src)) is null;
+    mv := format('mv_%s_biweekly', lower(src));
+    execute format(
+      'create materialized view if not exists %I as
+         select distinct on (t.ticker, (t.date::date - m.min_date) / 14)
+                t.date::date as date, t.ticker::text as ticker,
+                t.baseline_price::float8 as baseline_price,
+                t.impacted_price::float8 as impacted_price
+           from %I t
+           join (select ticker, min(date::date) as min_date
+                   from %I
+                  where impacted_price is not null
+                  group by ticker) m using (ticker)
+          where t.impacted_price is not null
+          order by t.ticker, (t.date::date - m.min_date) / 14, t.date::date',
+      mv, src, src
+    );
+    execute format('create unique index if not exists %I on %I (ticker, date)', mv || '_key', mv);
+  end loop;
+end
+$$;
+
+-- Refresh every view above. CONCURRENTLY keeps them readable meanwhile
+-- (it needs the unique indexes created with each view).
+create or replace function refresh_dashboard_views()
+returns void
+language plpgsql
+as $$
+declare
+  mv text;
+begin
+  for mv in
+    select matviewname from pg_matviews
+     where schemaname = 'public' and matviewname like 'mv\_%\_biweekly'
+  loop
+    execute format('refresh materialized view concurrently %I', mv);
+  end loop;
+end
+$$;
+
+-- PostgREST exposes every function as an RPC; keep this one server-side
+-- only. The backend must use SUPABASE_SERVICE_ROLE_KEY to call it.
+revoke execute on function refresh_dashboard_views() from public, anon, authenticated;
+grant execute on function refresh_dashboard_views() to service_role;
@@ -0,0 +1,88 @@
+-- B-tree indexes matching the dashboard/map query patterns.
+--
+-- Run in the Supabase SQL editor. CREATE INDEX CONCURRENTLY cannot run
+-- inside a transaction block, so execute the statements one at a time (or
+-- paste the file into a session without BEGIN/COMMIT). Every statement is
+-- IF NOT EXISTS and safe to re-run; drop the lines for any table that has
+-- not been loaded yet.
+--
+-- INCLUDE columns make the scans index-only: the rows come straight out of
+-- the index in date order, with no sort step and no heap fetch.
+
+-- /graph (nasdaq|sp500|dowjones): WHERE index = ? ORDER BY date
+create index concurrently if not exists idx_index_paths_index_date
+    on "Index_paths" (index, date) include (baseline_price, impacted_price);
+
+-- /chart-data baseline: WHERE index = ? ORDER BY date
+create index concurrently if not exists idx_index_baseline_index_date
+    on index_baseline (index, date) include (baseline_price);
+
+-- /tariff-prob and /api/map/country-sectors: WHERE country = ? [AND sector = ?] ORDER BY sector
+create index concurrently if not exists idx_country_tariff_prob_country_sector
+    on country_tariff_prob (country, sector) include (tariff_risk_prob);
+
+-- /chart-data sector_top10: ORDER BY date, ticker
+create index concurrently if not exists idx_aerospace_top10_date_ticker
+    on "Aerospace_top10" (date, ticker) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_agriculture_top10_date_ticker
+    on "Agriculture_top10" (date, ticker) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_automotive_top10_date_ticker
+    on "Automotive_top10" (date, ticker) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_energy_top10_date_ticker
+    on "Energy_top10" (date, ticker) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_lumber_top10_date_ticker
+    on "Lumber_top10" (date, ticker) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_maritime_top10_date_ticker
+    on "Maritime_top10" (date, ticker) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_metals_top10_date_ticker
+    on "Metals_top10" (date, ticker) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_minerals_top10_date_ticker
+    on "Minerals_top10" (date, ticker) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_pharmaceuticals_top10_date_ticker
+    on "Pharmaceuticals_top10" (date, ticker) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_steel_aluminum_top10_date_ticker
+    on "Steel_aluminum_top10" (date, ticker) include (baseline_price, impacted_price);
+
+-- /graph top10 (fallback when the biweekly views are absent): ORDER BY ticker, date
+create index concurrently if not exists idx_aerospace_top10_ticker_date
+    on "Aerospace_top10" (ticker, date) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_agriculture_top10_ticker_date
+    on "Agriculture_top10" (ticker, date) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_automotive_top10_ticker_date
+    on "Automotive_top10" (ticker, date) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_energy_top10_ticker_date
+    on "Energy_top10" (ticker, date) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_lumber_top10_ticker_date
+    on "Lumber_top10" (ticker, date) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_maritime_top10_ticker_date
+    on "Maritime_top10" (ticker, date) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_metals_top10_ticker_date
+    on "Metals_top10" (ticker, date) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_minerals_top10_ticker_date
+    on "Minerals_top10" (ticker, date) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_pharmaceuticals_top10_ticker_date
+    on "Pharmaceuticals_top10" (ticker, date) include (baseline_price, impacted_price);
+create index concurrently if not exists idx_steel_aluminum_top10_ticker_date
+    on "Steel_aluminum_top10" (ticker, date) include (baseline_price, impacted_price);
+
+-- /chart-data sp500|dow|nasdaq with a sector: ORDER BY date
+create index concurrently if not exists idx_aerospace_index_date
+    on "Aerospace_index" (date) include ("SP500", "DOW", "NASDAQ");
+create index concurrently if not exists idx_agriculture_index_date
+    on "Agriculture_index" (date) include ("SP500", "DOW", "NASDAQ");
+create index concurrently if not exists idx_automotive_index_date
+    on "Automotive_index" (date) include ("SP500", "DOW", "NASDAQ");
+create index concurrently if not exists idx_energy_index_date
+    on "Energy_index" (date) include ("SP500", "DOW", "NASDAQ");
+create index concurrently if not exists idx_lumber_index_date
+    on "Lumber_index" (date) include ("SP500", "DOW", "NASDAQ");
+create index concurrently if not exists idx_maritime_index_date
+    on "Maritime_index" (date) include ("SP500", "DOW", "NASDAQ");
+create index concurrently if not exists idx_metals_index_date
+    on "Metals_index" (date) include ("SP500", "DOW", "NASDAQ");
+create index concurrently if not exists idx_minerals_index_date
+    on "Minerals_index" (date) include ("SP500", "DOW", "NASDAQ");
+create index concurrently if not exists idx_pharmaceuticals_index_date
+    on "Pharmaceuticals_index" (date) include ("SP500", "DOW", "NASDAQ");
+create index concurrently if not exists idx_steel_aluminum_index_date
+    on "Steel_aluminum_index" (date) include ("SP500", "DOW", "NASDAQ");
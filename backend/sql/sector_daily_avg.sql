@@ -0,0 +1,24 @@
+-- Per-date sector averages for the dashboard /chart-data endpoint.
+--
+-- Run once in the Supabase SQL editor. The backend calls this through
+-- supabase.rpc("sector_daily_avg", {"tbl": ...}) and falls back to averaging
+-- the per-ticker rows in Python when it is not installed.
+
+-- {Sector}_top10 (long format) → one row per date with the cross-ticker mean
+-- of baseline_price and impacted_price (AVG skips NULLs).
+-- tbl is quoted with %I, so arbitrary input cannot inject SQL.
+create or replace function sector_daily_avg(tbl text)
+returns table (date date, avg_baseline double precision, avg_adjusted double precision)
+language plpgsql stable
+as $$
+begin
+  return query execute format(
+    'select t.date::date, avg(t.baseline_price)::float8, avg(t.impacted_price)::float8
+       from %I t
+      where t.ticker is not null and t.date is not null
+      group by t.date::date
+      order by t.date::date',
+    tbl
+  );
+end
+$$;
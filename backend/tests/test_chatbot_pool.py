@@ -0,0 +1,101 @@
+"""
+_ConnectionPool checkout/return behaviour, with _connect stubbed out (no
+Snowflake needed). Run from backend/:  python -m pytest tests
+"""
+
+import asyncio
+
+import pytest
+
+from app.api import chatbot
+
+
+class _FakeConn:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def _stub_connect(monkeypatch):
+    monkeypatch.setattr(chatbot, "_connect", _FakeConn)
+
+
+def test_waiter_proceeds_when_holder_discards_its_connection():
+    async def run():
+        pool = chatbot._ConnectionPool(1)
+        holding = asyncio.Event()
+
+        async def holder():
+            with pytest.raises(RuntimeError):
+                async with pool.connection():
+                    holding.set()
+                    await asyncio.sleep(0.05)
+                    raise RuntimeError("query failed")
+
+        async def waiter():
+            await holding.wait()
+            async with pool.connection() as conn:
+                return conn
+
+        _, conn = await asyncio.wait_for(asyncio.gather(holder(), waiter()), timeout=2)
+        assert not conn.closed
+        assert pool._created == 1 and pool._idle.qsize() == 1
+
+    asyncio.run(run())
+
+
+def test_closed_idle_connection_is_replaced():
+    async def run():
+        pool = chatbot._ConnectionPool(1)
+        async with pool.connection() as first:
+            pass
+        first.close()   # e.g. session expired while idle
+        async with pool.connection() as second:
+            assert second is not first and not second.closed
+        assert pool._created == 1
+
+    asyncio.run(run())
+
+
+def test_checkouts_never_exceed_size():
+    async def run():
+        pool = chatbot._ConnectionPool(2)
+        active = peak = 0
+
+        async def use():
+            nonlocal active, peak
+            async with pool.connection():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(use() for _ in range(8)))
+        assert peak == 2 and pool._created == 2
+
+    asyncio.run(run())
+
+
+def test_semantic_cache_hit_holds_no_connection(monkeypatch):
+    async def run():
+        pool = chatbot._ConnectionPool(1)
+        monkeypatch.setattr(chatbot, "_pool", pool)
+        monkeypatch.setattr(chatbot, "_is_configured", lambda: True)
+        monkeypatch.setattr(chatbot._response_cache, "lookup", lambda msg, ctx: "cached answer")
+        chatbot._CTX_CACHE["ctx"] = "Tariff Risk Data Context:\nCHINA,Energy,21.7%"
+        try:
+            async with pool.connection():   # the only slot is busy
+                resp = await asyncio.wait_for(
+                    chatbot.chat(chatbot.ChatRequest(message="China tariffs?")), timeout=2,
+                )
+        finally:
+            chatbot._CTX_CACHE.clear()
+        assert resp.response == "cached answer"
+
+    asyncio.run(run())
@@ -34,8 +34,8 @@ def api_call(prompt: str):
     print(f"[INFO] Sending API request with prompt: {prompt}")
     try:
         cursor = st.session_state.CONN.cursor()
-        escaped_prompt = prompt.replace("'", "\\'")
-        cursor.execute(f"SELECT SNOWFLAKE.CORTEX.COMPLETE('llama3.1-8b', '{escaped_prompt}')")
+        # Bound parameters: the connector quotes the prompt, no manual escaping.
+        cursor.execute("SELECT SNOWFLAKE.CORTEX.COMPLETE(%s, %s)", (MODEL_NAME, prompt))
         result = cursor.fetchone()[0]
         print(f"[INFO] Got response: {result}")
         yield result
@@ -64,20 +64,23 @@ def connect_to_snowflake():
             st.error('Connection not established. Check that you have correctly entered your Snowflake credentials!', icon="🚨")    
 
 
+# Cached for 5 minutes so each chat message doesn't re-query Snowflake.
+# The leading underscore keeps Streamlit from trying to hash the connection.
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_tariff_context(_conn):
+    # Query your new table
+    query = "SELECT * FROM HACKLYTICS_DB.PUBLIC.COUNTRY_TARIFF_RISK LIMIT 500;"
+    cursor = _conn.cursor()
+    cursor.execute(query)
+
+    # Fetch the rows and turn them into a readable string for the LLM
+    rows = cursor.fetchall()
+    return "Tariff Risk Data Context:\n" + "".join(f"{row}\n" for row in rows)
+
+
 def get_tariff_context():
     try:
-        # Query your new table
-        query = "SELECT * FROM HACKLYTICS_DB.PUBLIC.COUNTRY_TARIFF_RISK LIMIT 500;"
-        cursor = st.session_state.CONN.cursor()
-        cursor.execute(query)
-        
-        # Fetch the rows and turn them into a readable string for the LLM
-        rows = cursor.fetchall()
-        context_string = "Tariff Risk Data Context:\n"
-        for row in rows:
-            context_string += f"{row}\n"
-            
-        return context_string
+        return _load_tariff_context(st.session_state.CONN)
     except Exception as e:
         return "No data available."
 
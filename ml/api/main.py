@@ -45,10 +45,14 @@ app = FastAPI(
 
 _model_pkg: dict | None = None
 
+# Sorted panel countries/sectors, extracted once when the artifacts load.
+_countries: list[str] = []
+_sectors: list[str] = []
+
 
 @app.on_event("startup")
 async def _startup() -> None:
-    global _model_pkg
+    global _model_pkg, _countries, _sectors
     try:
         _model_pkg = load_artifacts(ARTIFACTS_DIR)
         print(f"[API] Model loaded — mode={_model_pkg['mode']}, "
@@ -56,6 +60,11 @@ async def _startup() -> None:
     except FileNotFoundError:
         print("[API] WARNING: No artifacts found. Run train.py first.")
         _model_pkg = None
+        return
+
+    panel = _model_pkg["feature_panel"]
+    _countries = sorted(panel["country"].dropna().unique().tolist())
+    _sectors   = sorted(panel["sector"].dropna().unique().tolist())
 
 
 @app.get("/health")
@@ -95,9 +104,7 @@ def list_countries() -> dict:
     """Return all countries in the training panel."""
     if _model_pkg is None:
         raise HTTPException(status_code=503, detail="Model not loaded.")
-    panel = _model_pkg["feature_panel"]
-    countries = sorted(panel["country"].dropna().unique().tolist())
-    return {"countries": countries}
+    return {"countries": _countries}
 
 
 @app.get("/sectors")
@@ -105,6 +112,4 @@ def list_sectors() -> dict:
     """Return all sectors in the training panel."""
     if _model_pkg is None:
         raise HTTPException(status_code=503, detail="Model not loaded.")
-    panel = _model_pkg["feature_panel"]
-    sectors = sorted(panel["sector"].dropna().unique().tolist())
-    return {"sectors": sectors}
+    return {"sectors": _sectors}
@@ -2,44 +2,99 @@
 Export country × sector tariff risk table for Supabase.
 
 FAST version:
-- Compute sector model probabilities once per sector
+- Compute sector model probabilities once, in one batched model call,
+  and cache them in artifacts/sector_prob_cache.npz until the sector
+  artifacts change
 - Apply per-country multiplier (0.5–2.0)
-- Build full matrix
+- Build full matrix as one outer product, DataFrame built column-wise
 
 Run from project root:
     python export_country_sector_probs.py
 
 Output:
     artifacts/country_sector_tariff_probs.csv
+    artifacts/country_sector_tariff_probs.parquet
 """
 
 import os
 import json
+import hashlib
 import joblib
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 
-from src.model import _predict_from_pkg  # uses your existing inference helper
+from src.model import _predict_probs_from_pkg  # batched _predict_from_pkg
 
 ARTIFACTS_DIR = "artifacts"
 
 
-def clamp(x: float, lo: float = 0.0, hi: float = 0.99) -> float:
-    return float(max(lo, min(hi, x)))
+PROB_CAP = 0.99   # clamp for base_prob × multiplier
 
 
-def make_id(country: str, sector: str) -> str:
-    clean_country = str(country).strip().upper().replace(" ", "_")
+def make_ids(country: pd.Series, sector: pd.Series) -> pd.Series:
+    """COUNTRY_SECTOR keys for whole columns, via pandas' vectorised string ops."""
+    clean_country = country.astype(str).str.strip().str.upper().str.replace(" ", "_", regex=False)
     clean_sector = (
-        str(sector).strip().upper()
-        .replace(" ", "_")
-        .replace("&", "AND")
-        .replace("/", "_")
+        sector.astype(str).str.strip().str.upper()
+        .str.replace(" ", "_", regex=False)
+        .str.replace("&", "AND", regex=False)
+        .str.replace("/", "_", regex=False)
     )
-    return f"{clean_country}_{clean_sector}"
+    return clean_country + "_" + clean_sector
+
+
+def load_sector_probs(
+    model_path: str, scaler_path: str, panel_path: str, schema_path: str,
+) -> tuple[list[str], np.ndarray]:
+    """Load the sector model + panel and score every sector in one batched call."""
+    # mmap_mode="r": numpy buffers are mapped from the file instead of copied in
+    sector_model = joblib.load(model_path, mmap_mode="r")
+    sector_scaler = joblib.load(scaler_path, mmap_mode="r")
+    panel_tbl = pa_csv.read_csv(
+        panel_path,
+        convert_options=pa_csv.ConvertOptions(column_types={"month_start": pa.timestamp("ns")}),
+    )
+
+    # Only each sector's latest month is ever scored, so cut the panel down to
+    # those rows in Arrow (group_by max + join) before handing pandas anything.
+    # _row keeps the file order, which decides ties the same way as before.
+    panel_tbl = panel_tbl.append_column("_row", pa.array(np.arange(panel_tbl.num_rows)))
+    latest_month = panel_tbl.group_by("sector_std").aggregate([("month_start", "max")])
+    latest_tbl = (
+        panel_tbl.join(latest_month, "sector_std")
+        .filter(pc.field("month_start") == pc.field("month_start_max"))
+        .sort_by("_row")
+        .drop_columns(["_row", "month_start_max"])
+    )
+    sector_panel = latest_tbl.to_pandas()
+
+    with open(schema_path) as f:
+        sector_meta = json.load(f)
+
+    sector_pkg = dict(sector_meta)
+    sector_pkg["model"] = sector_model
+    sector_pkg["scaler"] = sector_scaler
+    sector_pkg["feature_panel"] = sector_panel
+
+    sectors = sorted(sector_panel["sector_std"].dropna().astype(str).unique())
+    return sectors, _predict_probs_from_pkg(sectors, "sector_std", sector_pkg)
+
+
+def artifacts_fingerprint(*paths: str) -> str:
+    """Hash of (path, size, mtime) for each file; changes whenever one is rewritten."""
+    h = hashlib.sha256()
+    for path in paths:
+        st = os.stat(path)
+        h.update(f"{path}|{st.st_size}|{st.st_mtime_ns};".encode())
+    return h.hexdigest()
 
 
 # -----------------------------
-# Load sector model artifacts
+# Sector model artifacts
 # -----------------------------
 model_path = os.path.join(ARTIFACTS_DIR, "model_sector.pkl")
 scaler_path = os.path.join(ARTIFACTS_DIR, "scaler_sector.pkl")
@@ -53,18 +108,6 @@ if not os.path.exists(panel_path):
 if not os.path.exists(schema_path):
     raise FileNotFoundError("artifacts/feature_schema_sector.json not found. Run train.py first.")
 
-sector_model = joblib.load(model_path)
-sector_scaler = joblib.load(scaler_path)
-sector_panel = pd.read_csv(panel_path, parse_dates=["month_start"])
-
-with open(schema_path) as f:
-    sector_meta = json.load(f)
-
-sector_pkg = dict(sector_meta)
-sector_pkg["model"] = sector_model
-sector_pkg["scaler"] = sector_scaler
-sector_pkg["feature_panel"] = sector_panel
-
 # -----------------------------
 # Load country multipliers
 # -----------------------------
@@ -81,42 +124,63 @@ with open(mult_path) as f:
 countries = sorted(country_multipliers.keys())
 
 # -----------------------------
-# Compute sector probabilities ONCE
+# Sector probabilities (cached)
 # -----------------------------
-sectors = sorted(sector_panel["sector_std"].dropna().astype(str).unique())
+# Sector probabilities only depend on the sector artifacts, so they are cached
+# in an .npz keyed by those files' fingerprint; a warm run skips loading and
+# scoring the model entirely.
+cache_path = os.path.join(ARTIFACTS_DIR, "sector_prob_cache.npz")
+cache_key = artifacts_fingerprint(model_path, scaler_path, panel_path, schema_path)
+
+sectors = None
+if os.path.exists(cache_path):
+    with np.load(cache_path) as cached:
+        if str(cached["key"]) == cache_key:
+            sectors = cached["sectors"].tolist()
+            probs = cached["probs"]
+
+if sectors is None:
+    sectors, probs = load_sector_probs(model_path, scaler_path, panel_path, schema_path)
+    np.savez(cache_path, key=cache_key, sectors=np.array(sectors), probs=probs)
+else:
+    print(f"Sector probabilities: cached ({cache_path})")
 
 print(f"Countries: {len(countries)}")
 print(f"Sectors:   {len(sectors)}")
 
-sector_prob = {}
-for sector in sectors:
-    s_res = _predict_from_pkg(sector, "sector_std", sector_pkg)
-    sector_prob[sector] = float(s_res.get("tariff_risk_prob", 0.0))
+# Rounded like _predict_from_pkg's result.
+sector_prob = {sector: round(float(p), 4) for sector, p in zip(sectors, probs)}
 
 # -----------------------------
 # Build full matrix
 # -----------------------------
-rows = []
-for country in countries:
-    m = float(country_multipliers.get(country, 1.0))
-    for sector in sectors:
-        base_p = sector_prob.get(sector, 0.0)
-        p = clamp(base_p * m)
-
-        rows.append({
-            "id": make_id(country, sector),     # <- primary key for Supabase
-            "country": country,
-            "sector": sector,
-            "sector_base_prob": round(base_p, 6),
-            "country_multiplier": round(m, 6),
-            "tariff_risk_prob": round(p, 6),
-            "tariff_risk_pct": f"{round(p * 100, 1)}%",
-        })
-
-df_out = pd.DataFrame(rows)
-
+# Row order is country-major: row i*S + j is (countries[i], sectors[j]).
+n_countries, n_sectors = len(countries), len(sectors)
+base = np.array([sector_prob[s] for s in sectors])
+mult = np.array([float(country_multipliers.get(c, 1.0)) for c in countries])
+prob = np.outer(mult, base)
+np.clip(prob, 0.0, PROB_CAP, out=prob)   # in place, no second matrix
+prob = prob.ravel()
+
+df_out = pd.DataFrame({
+    "country": np.repeat(countries, n_sectors),
+    "sector": np.tile(sectors, n_countries),
+    "sector_base_prob": np.round(np.tile(base, n_countries), 6),
+    "country_multiplier": np.round(np.repeat(mult, n_sectors), 6),
+    "tariff_risk_prob": np.round(prob, 6),
+    "tariff_risk_pct": np.char.add(np.round(prob * 100, 1).astype(str), "%"),
+})
+df_out.insert(0, "id", make_ids(df_out["country"], df_out["sector"]))   # <- primary key for Supabase
+
+# The CSV keeps pandas' formatting (unquoted strings, 1.0 not 1) so existing
+# Supabase/Snowflake import configs still load it; Arrow writes only the
+# parquet copy for typed downstream loads.
 out_path = os.path.join(ARTIFACTS_DIR, "country_sector_tariff_probs.csv")
 df_out.to_csv(out_path, index=False)
+pq.write_table(
+    pa.Table.from_pandas(df_out, preserve_index=False),
+    os.path.splitext(out_path)[0] + ".parquet",
+)
 
-print(f"\nExport complete: {out_path}")
+print(f"\nExport complete: {out_path} (+ .parquet)")
 print(f"Total rows: {len(df_out)}")
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""
+Disk-backed response cache for the scraper's LLM analysis calls.
+=================================================================
+Exact layer   — diskcache keyed on SHA-256 of (model, system prompt, title,
+                document text). The scraper calls the model at temperature 0,
+                so a repeated request always returns the same answer.
+
+Semantic layer — optional. When LLM_SEMANTIC_CACHE=1 and both
+                sentence-transformers and faiss are installed, titles and
+                the start of each document are embedded with all-MiniLM-L6-v2.
+                A hit needs a similar title (cosine >= 0.92) AND similar
+                text (cosine >= 0.95), so re-worded copies of the same
+                document match but a different document under a formulaic,
+                near-identical title does not. Entries are scoped by
+                (model, system prompt), like the exact keys.
+"""
+
+import os, hashlib, logging
+from pathlib import Path
+
+import diskcache
+import numpy as np
+import orjson
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR          = Path(__file__).resolve().parent / ".llm_cache"
+CACHE_TTL          = 30 * 86400     # seconds
+SEMANTIC_THRESHOLD      = 0.92   # title cosine
+SEMANTIC_TEXT_THRESHOLD = 0.95   # document-text cosine, checked on title matches
+SEMANTIC_MODEL          = "sentence-transformers/all-MiniLM-L6-v2"
+
+_SEM_INDEX_PREFIX = "__semantic__:"   # + scope -> list of (title, text excerpt, exact_key)
+_SEM_TEXT_CHARS   = 2000              # MiniLM truncates at 256 tokens anyway
+_SEM_CANDIDATES   = 5                 # title neighbours checked against the text
+
+_cache = diskcache.Cache(str(CACHE_DIR))
+
+
+def make_key(model: str, system_prompt: str, title: str, text: str) -> str:
+    payload = orjson.dumps(
+        {"m": model, "p": system_prompt, "t": title, "d": text},
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def make_scope(model: str, system_prompt: str) -> str:
+    """Semantic-layer namespace: entries only match within one (model, prompt)."""
+    payload = orjson.dumps({"m": model, "p": system_prompt}, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+# ── Semantic layer (lazy, optional) ───────────────────────────────────────────
+_sem = None   # (encoder, faiss) once loaded; False if unavailable
+_scopes: dict = {}   # scope -> [title index, text embeddings, [exact_key, ...]]
+
+
+def _semantic():
+    global _sem
+    if _sem is not None:
+        return _sem or None
+    if os.getenv("LLM_SEMANTIC_CACHE", "") != "1":
+        _sem = False
+        return None
+    try:
+        import faiss
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        log.warning("  LLM_SEMANTIC_CACHE=1 but sentence-transformers/faiss missing — exact cache only.")
+        _sem = False
+        return None
+
+    _sem = (SentenceTransformer(SEMANTIC_MODEL), faiss)
+    return _sem
+
+
+def _embed(encoder, texts: list):
+    return encoder.encode(texts, normalize_embeddings=True)
+
+
+def _scope_index(scope: str):
+    """(encoder, [title index, text embeddings, keys]) for a scope, or None if disabled."""
+    sem = _semantic()
+    if sem is None:
+        return None
+    encoder, faiss = sem
+    entry = _scopes.get(scope)
+    if entry is None:
+        dim     = encoder.get_sentence_embedding_dimension()
+        index   = faiss.IndexFlatIP(dim)
+        entries = _get(_SEM_INDEX_PREFIX + scope) or []
+        texts   = np.empty((0, dim), dtype=np.float32)
+        if entries:
+            index.add(_embed(encoder, [t for t, _, _ in entries]))
+            texts = _embed(encoder, [d for _, d, _ in entries])
+        entry = _scopes[scope] = [index, texts, [k for _, _, k in entries]]
+    return encoder, entry
+
+
+# Values are stored as orjson bytes rather than diskcache's default pickle.
+def _get(key: str):
+    raw = _cache.get(key)
+    return orjson.loads(raw) if isinstance(raw, bytes) else None   # ignores pre-orjson pickles
+
+
+def lookup(key: str, scope: str, title: str, text: str) -> dict | None:
+    """Return a cached analysis for this request, or None on a miss."""
+    hit = _get(key)
+    if hit is not None:
+        return hit
+
+    if not title or not text:
+        return None
+    sem = _scope_index(scope)
+    if sem is None:
+        return None
+    encoder, (index, texts, keys) = sem
+    if index.ntotal == 0:
+        return None
+    D, I = index.search(_embed(encoder, [title]), min(_SEM_CANDIDATES, index.ntotal))
+    cands = [int(i) for d, i in zip(D[0], I[0]) if i >= 0 and d >= SEMANTIC_THRESHOLD]
+    if not cands:
+        return None
+    sims = texts[cands] @ _embed(encoder, [text[:_SEM_TEXT_CHARS]])[0]
+    best = int(sims.argmax())
+    if sims[best] >= SEMANTIC_TEXT_THRESHOLD:
+        return _get(keys[cands[best]])
+    return None
+
+
+def store(key: str, scope: str, title: str, text: str, value: dict) -> None:
+    _cache.set(key, orjson.dumps(value), expire=CACHE_TTL)
+
+    if not title or not text:
+        return
+    sem = _scope_index(scope)
+    if sem is None:
+        return
+    encoder, entry = sem
+    excerpt = text[:_SEM_TEXT_CHARS]
+    entry[0].add(_embed(encoder, [title]))
+    entry[1] = np.vstack([entry[1], _embed(encoder, [excerpt])])
+    entry[2].append(key)
+    index_key = _SEM_INDEX_PREFIX + scope
+    _cache.set(index_key, orjson.dumps((_get(index_key) or []) + [(title, excerpt, key)]))
@@ -22,21 +22,29 @@ SOURCE RANKING (why these are the best)
                             Covers bilateral deals Rev/WH miss.
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-INSTALL:  pip install requests beautifulsoup4 lxml pandas python-dotenv
+INSTALL:  pip install "httpx[http2]" lxml pandas python-dotenv diskcache tenacity orjson
 SETUP:    Create .env with: OPENROUTER_API_KEY=sk-or-...
 RUN:      python political_transcript_scraper.py
 OUTPUT:   Saved automatically to your Desktop (or set OUTPUT_DIR below)
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
 
-import os, time, json, csv, re, logging
+import os, csv, re, logging, asyncio, shelve
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import lxml.html
+from lxml import etree
+from lxml.etree import XPath
+import numpy as np
+import orjson
 import pandas as pd
 from dotenv import load_dotenv
+from tenacity import retry, stop_after_attempt, wait_random_exponential, retry_if_exception_type
+
+import llm_cache
 
 # ══════════════════════════════════════════════════════════════════════════════
 # CONFIG — edit OUTPUT_DIR if you want the CSV somewhere other than Desktop
@@ -77,6 +85,29 @@ HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+SCRAPE_CONCURRENCY = 8      # max pages fetched at once
+REQUEST_DELAY      = 0.4    # polite per-request delay (seconds), held inside the semaphore
+LLM_CONCURRENCY    = 5      # OpenRouter concurrent-request ceiling
+LLM_BATCH_SIZE     = 4      # documents scored per OpenRouter call
+PROCESS_POOL_MIN   = 100    # batches at least this large parse HTML in worker processes
+TEXT_CAP           = 12000  # chars of body text kept per document
+
+# Settings for the one pooled HTTP/2 client main() opens per run and passes to
+# every outbound request (scrapes + LLM calls), so same-host requests reuse
+# warm TCP/TLS connections.
+_CLIENT_KWARGS = dict(
+    http2=True,
+    follow_redirects=True,
+    headers=HEADERS,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=30),
+    timeout=httpx.Timeout(18.0, connect=5.0),
+)
+
+# Precompiled text-cleanup patterns (run once per document / LLM response)
+_WS_RE    = re.compile(r"\n{3,}")
+_FENCE_RE = re.compile(r"```(?:json)?")
+_NL_TABLE = str.maketrans({"\n": " ", "\r": " "})
+
 # ══════════════════════════════════════════════════════════════════════════════
 # 20 CONFIRMED TARGETS
 # All verified as server-side rendered, no JS required, confirmed live.
@@ -199,109 +230,289 @@ TARGETS = [
 ]
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# HTTP — retried on transient failures (timeouts, connection resets, 429, 5xx)
+# ══════════════════════════════════════════════════════════════════════════════
+MAX_RETRY_AFTER = 30.0   # cap on a server-supplied Retry-After (seconds)
+
+
+class RetryableStatus(httpx.HTTPStatusError):
+    """429 / 5xx response — worth another attempt."""
+
+
+def _retry_after(r: httpx.Response) -> float:
+    try:
+        return min(float(r.headers.get("Retry-After", 0)), MAX_RETRY_AFTER)
+    except ValueError:   # HTTP-date form — fall back to the backoff schedule
+        return 0.0
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_random_exponential(multiplier=0.5, min=0.5, max=8),
+    retry=retry_if_exception_type((httpx.TransportError, RetryableStatus)),
+    reraise=True,
+)
+async def _send(client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+    r = await client.request(method, url, **kwargs)
+    if r.status_code == 429 or r.status_code >= 500:
+        if r.status_code == 429:
+            await asyncio.sleep(_retry_after(r))
+        raise RetryableStatus(f"{r.status_code} from {url}", request=r.request, response=r)
+    return r
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # SCRAPERS
 # ══════════════════════════════════════════════════════════════════════════════
-def scrape_page(url: str) -> dict:
-    """Universal scraper — works across FR, WH, Congress, USTR."""
+def _cls(name: str) -> str:
+    """XPath predicate equivalent to the CSS class selector `.name`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Selectors are tried in priority order; each XPath returns the first match
+# in document order, mirroring BeautifulSoup's select_one().
+_TITLE_XPS = [
+    XPath("(//h1)[1]"),
+    XPath(f"(//h2[{_cls('document-title')}])[1]"),
+    XPath(f"(//*[{_cls('title')}])[1]"),
+    XPath("(//title)[1]"),
+]
+_BODY_XPS = [
+    XPath(f"(//*[{_cls('full-text')}])[1]"),              # Federal Register
+    XPath("(//*[@id='fulltext_content_area'])[1]"),       # Federal Register alt
+    XPath(f"(//*[{_cls('field-docs-content')}])[1]"),     # UCSB
+    XPath(f"(//*[{_cls('entry-content')}])[1]"),          # WH fact sheets
+    XPath("(//article)[1]"),
+    XPath("(//main)[1]"),
+    XPath("(//body)[1]"),
+]
+_CHROME_XP = XPath(f".//*[{_cls('sidebar')} or {_cls('navigation')}]")
+_P_XP      = XPath("//p")
+
+
+def _text(el, sep: str) -> str:
+    """Stripped, non-empty text nodes joined by `sep` (BS4 get_text(sep, strip=True))."""
+    return sep.join(t for t in (t.strip() for t in el.itertext()) if t)
+
+
+def _collect(el, cap: int) -> str:
+    """
+    _text(el, "\n") with whitespace cleanup and the length cap fused into one
+    pass: stops walking text nodes as soon as `cap` chars are collected, so
+    no full-length intermediate string is built or regex-scanned.
+    """
+    buf, n = [], 0
+    for t in el.itertext():
+        t = t.strip()
+        if not t:
+            continue
+        if "\n\n\n" in t:
+            t = _WS_RE.sub("\n\n", t)
+        if buf:
+            buf.append("\n")
+            n += 1
+        if n + len(t) >= cap:
+            buf.append(t[:cap - n])
+            break
+        buf.append(t)
+        n += len(t)
+    return "".join(buf)
+
+
+def _first(doc, xps):
+    for xp in xps:
+        hit = xp(doc)
+        if hit:
+            return hit[0]
+    return None
+
+
+def parse_page(html: bytes) -> dict:
+    """Extract title + body text from raw HTML (CPU-bound; run off the event loop)."""
     try:
-        r = requests.get(url, headers=HEADERS, timeout=18)
-        if r.status_code == 404:
-            log.warning(f"  404: {url}")
-            return {"title": "", "raw_text": ""}
-        r.raise_for_status()
-    except requests.RequestException as e:
-        log.warning(f"  Fetch error: {e}")
+        doc = lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError):
         return {"title": "", "raw_text": ""}
 
-    soup  = BeautifulSoup(r.text, "lxml")
-
     # Title — try multiple selectors
-    title = ""
-    for sel in ["h1", "h2.document-title", ".title", "title"]:
-        tag = soup.select_one(sel)
-        if tag:
-            title = tag.get_text(" ", strip=True)
-            break
+    tag   = _first(doc, _TITLE_XPS)
+    title = _text(tag, " ") if tag is not None else ""
 
     # Body — progressively wider selectors
-    body = (
-        soup.select_one(".full-text")                          # Federal Register
-        or soup.select_one("#fulltext_content_area")           # Federal Register alt
-        or soup.select_one(".field-docs-content")              # UCSB
-        or soup.select_one(".entry-content")                   # WH fact sheets
-        or soup.select_one("article")
-        or soup.select_one("main")
-        or soup.select_one("body")
-    )
-
-    if body:
+    body = _first(doc, _BODY_XPS)
+
+    if body is not None:
         # Remove nav, scripts, footers, sidebars
-        for tag in body.select("nav, script, style, footer, aside, .sidebar, .navigation"):
-            tag.decompose()
-        raw_text = body.get_text("\n", strip=True)
+        etree.strip_elements(body, "script", "style", "nav", "footer", "aside", with_tail=False)
+        for tag in _CHROME_XP(body):
+            tag.drop_tree()
+        raw_text = _collect(body, TEXT_CAP)
     else:
-        raw_text = "\n".join(p.get_text(" ", strip=True) for p in soup.find_all("p"))
+        raw_text = "\n".join(_text(p, " ") for p in _P_XP(doc))
+        raw_text = _WS_RE.sub("\n\n", raw_text).strip()
+
+    return {"title": title, "raw_text": raw_text[:TEXT_CAP]}
 
-    # Clean up excessive whitespace
-    raw_text = re.sub(r"\n{3,}", "\n\n", raw_text).strip()
 
-    return {"title": title, "raw_text": raw_text[:12000]}
+# Executor for parse_page, chosen per run by main(). Threads avoid pickling for
+# the usual ~20 pages; large batches use processes to get past the GIL.
+_parse_pool: Executor | None = None
+
+
+def _make_parse_pool(n_pages: int) -> Executor:
+    if n_pages >= PROCESS_POOL_MIN:
+        return ProcessPoolExecutor(max_workers=os.cpu_count())
+    return ThreadPoolExecutor(max_workers=SCRAPE_CONCURRENCY)
+
+
+# Conditional-GET store: url → (etag, last_modified, parsed_dict). Opened for
+# the duration of main(); only the event-loop thread touches it.
+HTTP_CACHE_PATH = Path(__file__).resolve().parent / ".http_cache"
+_http_cache: shelve.Shelf | None = None
+
+
+async def scrape_page(client: httpx.AsyncClient, url: str) -> dict:
+    """Universal scraper — works across FR, WH, Congress, USTR."""
+    cached  = _http_cache.get(url) if _http_cache is not None else None
+    headers = {}
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    try:
+        r = await _send(client, "GET", url, headers=headers)
+        if r.status_code == 304 and cached:
+            log.info(f"       ↺ 304 Not Modified: {url.split('/')[-1][:50]}")
+            return cached[2]
+        if r.status_code == 404:
+            log.warning(f"  404: {url}")
+            return {"title": "", "raw_text": ""}
+        r.raise_for_status()
+    except httpx.HTTPError as e:
+        log.warning(f"  Fetch error: {e}")
+        return {"title": "", "raw_text": ""}
+
+    loop   = asyncio.get_running_loop()
+    parsed = await loop.run_in_executor(_parse_pool, parse_page, r.content)
+
+    etag, last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+    if _http_cache is not None and (etag or last_modified) and parsed["raw_text"]:
+        _http_cache[url] = (etag, last_modified, parsed)
+    return parsed
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # LLM — Gemini 2.5 Flash Lite via OpenRouter
 # ══════════════════════════════════════════════════════════════════════════════
 SYSTEM_PROMPT = """You are a quantitative macroeconomic analyst specializing in trade policy.
-Read the following US government document about tariff/trade policy.
-Output ONLY a valid JSON object with exactly four keys:
+Read the following US government documents about tariff/trade policy.
+They are given as a JSON array of {"id", "title", "text"} objects.
+Output ONLY a valid JSON array with one object per document, each with exactly five keys:
 
+"id"             — the document's id, copied exactly as given
 "Target_Entity"  — who the tariff targets: "Global", "China", "Mexico", "Canada", "EU", "South Korea", "Japan", "UK", "India", "Automotive", "Steel", "Aluminum", "Semiconductors", "Lumber", "Agriculture", or "None"
 "Action_Type"    — what is happening: "Enacted", "Modified", "Proposed", "Threatened", "Revoked", "Suspended", "Extended", or "None"
 "Imminence_Score"— float 0.0-1.0: 1.0=in effect now, 0.7=within 30 days, 0.5=within 90 days, 0.2=announced future, 0.0=no tariff content
 "Summary"        — one sentence: what tariff action, on what, at what rate (if mentioned)
 
-If no tariff content: {"Target_Entity":"None","Action_Type":"None","Imminence_Score":0.0,"Summary":"No tariff content found."}
+For a document with no tariff content: {"id":<id>,"Target_Entity":"None","Action_Type":"None","Imminence_Score":0.0,"Summary":"No tariff content found."}
 Output raw JSON only — no markdown, no explanation."""
 
 
-def analyze(text: str, title: str) -> dict:
+async def analyze_batch(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    docs: list[tuple[str, str]],
+) -> list[dict]:
+    """
+    Score several (text, title) documents in one OpenRouter call.
+
+    Batching amortizes the system prompt across LLM_BATCH_SIZE documents and
+    cuts the number of round trips. Cached documents are answered locally and
+    left out of the request. Returns one result per input, in input order.
+    """
     err = {"Target_Entity": "ERROR", "Action_Type": "ERROR", "Imminence_Score": -1.0, "Summary": "LLM failed."}
 
     if not OPENROUTER_API_KEY:
         log.warning("  No OPENROUTER_API_KEY — skipping LLM.")
-        return {"Target_Entity": "N/A", "Action_Type": "N/A", "Imminence_Score": -1.0, "Summary": "No API key."}
+        return [{"Target_Entity": "N/A", "Action_Type": "N/A", "Imminence_Score": -1.0, "Summary": "No API key."}
+                for _ in docs]
+
+    results: list[dict | None] = [None] * len(docs)
+    keys:    list[str]         = []
+    misses:  list[int]         = []
+    scope = llm_cache.make_scope(OPENROUTER_MODEL, SYSTEM_PROMPT)
+    for n, (text, title) in enumerate(docs):
+        key = llm_cache.make_key(OPENROUTER_MODEL, SYSTEM_PROMPT, title, text[:10000])
+        keys.append(key)
+        cached = llm_cache.lookup(key, scope, title, text[:10000])
+        if cached is not None:
+            log.info(f"       ↺ LLM cache hit: {title[:60]}")
+            results[n] = cached
+        else:
+            misses.append(n)
+
+    if not misses:
+        return results
+
+    payload_docs = [
+        {"id": n, "title": docs[n][1], "text": docs[n][0][:10000]} for n in misses
+    ]
 
     try:
-        resp = requests.post(
-            OPENROUTER_URL,
-            headers={
-                "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                "Content-Type":  "application/json",
-                **( {"HTTP-Referer": YOUR_SITE_URL} if YOUR_SITE_URL else {} ),
-                **( {"X-Title":      YOUR_SITE_NAME} if YOUR_SITE_NAME else {} ),
-            },
-            data=json.dumps({
-                "model":       OPENROUTER_MODEL,
-                "max_tokens":  250,
-                "temperature": 0.0,
-                "messages": [{
-                    "role": "user",
-                    "content": [{
-                        "type": "text",
-                        "text": f"{SYSTEM_PROMPT}\n\nTITLE: {title}\n\nDOCUMENT:\n{text[:10000]}"
-                    }]
-                }],
-            }),
-            timeout=25,
-        )
+        async with sem:
+            resp = await _send(
+                client, "POST",
+                OPENROUTER_URL,
+                headers={
+                    "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+                    "Content-Type":  "application/json",
+                    **( {"HTTP-Referer": YOUR_SITE_URL} if YOUR_SITE_URL else {} ),
+                    **( {"X-Title":      YOUR_SITE_NAME} if YOUR_SITE_NAME else {} ),
+                },
+                content=orjson.dumps({
+                    "model":       OPENROUTER_MODEL,
+                    "max_tokens":  250 * len(misses),
+                    "temperature": 0.0,
+                    "messages": [{
+                        "role": "user",
+                        "content": [{
+                            "type": "text",
+                            "text": f"{SYSTEM_PROMPT}\n\nDOCUMENTS:\n{orjson.dumps(payload_docs).decode()}"
+                        }]
+                    }],
+                }),
+                timeout=httpx.Timeout(25.0 * len(misses), connect=5.0),
+            )
         resp.raise_for_status()
-        raw = resp.json()["choices"][0]["message"]["content"].strip()
-        raw = re.sub(r"```(?:json)?", "", raw).strip().rstrip("`").strip()
-        return json.loads(raw)
+        raw = orjson.loads(resp.content)["choices"][0]["message"]["content"].strip()
+        raw = _FENCE_RE.sub("", raw).strip().rstrip("`").strip()
+        parsed = orjson.loads(raw)
+        if isinstance(parsed, dict):   # single-document batches sometimes come back unwrapped
+            parsed = [parsed]
+        by_id = {}
+        for item in parsed:
+            try:
+                by_id[int(item.pop("id"))] = item
+            except (KeyError, TypeError, ValueError):
+                continue
     except Exception as e:
         log.warning(f"  LLM error: {type(e).__name__}: {e}")
-        return {**err, "Summary": str(e)[:120]}
+        by_id = {}
+        err = {**err, "Summary": str(e)[:120]}
+
+    for n in misses:
+        item = by_id.get(n)
+        if item is None:
+            results[n] = err
+        else:
+            llm_cache.store(keys[n], scope, docs[n][1], docs[n][0][:10000], item)
+            results[n] = item
+    return results
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -327,6 +538,13 @@ def risk_score(action: str, imminence) -> float:
         return 0.0
 
 
+def risk_score_bulk(df: pd.DataFrame) -> np.ndarray:
+    """Vectorized risk_score over a whole frame (e.g. re-scoring the historical CSV)."""
+    w   = df["Action_Type"].map(WEIGHTS).fillna(0.0).to_numpy(dtype=float)
+    imm = pd.to_numeric(df["Imminence_Score"], errors="coerce").fillna(0.0).to_numpy(dtype=float)
+    return np.round(w * imm * 100, 2)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # CSV — auto-saves to Desktop (or OUTPUT_DIR above)
 # ══════════════════════════════════════════════════════════════════════════════
@@ -336,98 +554,171 @@ COLS = [
     "Political_Risk_Score", "Summary", "raw_text_excerpt",
 ]
 
-def load_seen(path: Path) -> set:
+def _norm_url(url: str) -> str:
+    """Dedup key: drop the fragment and any trailing slash."""
+    return url.split("#", 1)[0].rstrip("/")
+
+
+def load_existing(path: Path) -> list[dict]:
+    """Rows already in the CSV — read once, used for dedup and the final summary."""
     if not path.exists():
-        return set()
+        return []
     try:
-        return set(pd.read_csv(path, usecols=["url"])["url"].dropna())
+        with open(path, newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
     except Exception:
-        return set()
+        return []
 
-def save_row(row: dict, path: Path):
-    is_new = not path.exists()
-    with open(path, "a", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=COLS)
-        if is_new:
-            w.writeheader()
-        w.writerow({c: row.get(c, "") for c in COLS})
+def save_row(writer: csv.DictWriter, row: dict):
+    writer.writerow({c: row.get(c, "") for c in COLS})
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # MAIN
 # ══════════════════════════════════════════════════════════════════════════════
-def run():
-    log.info("=" * 60)
-    log.info("Tariff Risk Scraper — Federal Register Edition")
-    log.info(f"Saving CSV to: {OUTPUT_CSV}")
-    log.info("=" * 60)
-
-    seen      = load_seen(OUTPUT_CSV)
-    processed = 0
-    errors    = 0
-
-    for i, target in enumerate(TARGETS, 1):
-        url    = target["url"]
-        source = target["source"]
-        date   = target["date"]
-
-        if url in seen:
-            log.info(f"[{i:02d}/20] SKIP  {source} {date}")
-            continue
-
-        log.info(f"[{i:02d}/20] FETCH {source} | {date}")
-
-        scraped = scrape_page(url)
-        title   = scraped["title"] or url.split("/")[-1].replace("-", " ").title()
-        text    = scraped["raw_text"]
+async def _scrape(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    i: int,
+    target: dict,
+) -> dict:
+    """Fetch + parse one target. Returns the target fields plus title/text."""
+    url = target["url"]
+
+    async with sem:
+        log.info(f"[{i:02d}/{len(TARGETS)}] FETCH {target['source']} | {target['date']}")
+        scraped = await scrape_page(client, url)
+        await asyncio.sleep(REQUEST_DELAY)   # minimal delay
+
+    text = scraped["raw_text"]
+    if text.strip():
+        log.info(f"       ✓ {len(text):,} chars — {url.split('/')[-1][:50]}")
+    else:
+        log.warning(f"       ✗ No content scraped: {url}")
 
-        if not text.strip():
-            log.warning(f"       ✗ No content scraped.")
-            errors += 1
-            result = {"Target_Entity": "None", "Action_Type": "None",
-                      "Imminence_Score": 0.0, "Summary": "No content scraped."}
-        else:
-            log.info(f"       ✓ {len(text):,} chars — calling Gemini...")
-            result = analyze(text, title)
+    return {
+        **target,
+        "title": scraped["title"] or url.split("/")[-1].replace("-", " ").title(),
+        "text":  text,
+    }
 
-        score = risk_score(result.get("Action_Type", "None"), result.get("Imminence_Score", 0.0))
 
-        row = {
+def _build_rows(scored: list[tuple[dict, dict]]) -> list[dict]:
+    """CSV rows for (doc, result) pairs, risk-scored together in one risk_score_bulk pass."""
+    rows = [
+        {
             "scraped_at":           datetime.now().isoformat(timespec="seconds"),
-            "pub_date":             date,
-            "source":               source,
-            "title":                title[:120],
-            "url":                  url,
+            "pub_date":             doc["date"],
+            "source":               doc["source"],
+            "title":                doc["title"][:120],
+            "url":                  doc["url"],
             "Target_Entity":        result.get("Target_Entity", ""),
             "Action_Type":          result.get("Action_Type", ""),
             "Imminence_Score":      result.get("Imminence_Score", 0.0),
-            "Political_Risk_Score": score,
+            "Political_Risk_Score": 0.0,
             "Summary":              result.get("Summary", ""),
-            "raw_text_excerpt":     text[:400].replace("\n", " "),
+            "raw_text_excerpt":     doc["text"][:400].translate(_NL_TABLE),
         }
+        for doc, result in scored
+    ]
+    scores = risk_score_bulk(pd.DataFrame(rows, columns=["Action_Type", "Imminence_Score"]))
 
-        save_row(row, OUTPUT_CSV)
-        seen.add(url)
-        processed += 1
-
+    for row, score in zip(rows, scores.tolist()):
+        row["Political_Risk_Score"] = score
         log.info(
-            f"       → {result.get('Action_Type'):10s} | "
-            f"{result.get('Target_Entity'):12s} | "
-            f"Score={score:7.2f} | {result.get('Summary','')[:60]}"
+            f"       → {str(row['Action_Type']):10s} | "
+            f"{str(row['Target_Entity']):12s} | "
+            f"Score={score:7.2f} | {str(row['Summary'])[:60]}"
         )
+    return rows
 
-        time.sleep(0.4)   # minimal delay
+
+async def _score_batch(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    batch: list[dict],
+) -> list[tuple[dict, dict]]:
+    log.info(f"       … scoring {len(batch)} documents with Gemini")
+    results = await analyze_batch(client, sem, [(d["text"], d["title"]) for d in batch])
+    return list(zip(batch, results))
+
+
+async def main():
+    global _parse_pool, _http_cache
+
+    log.info("=" * 60)
+    log.info("Tariff Risk Scraper — Federal Register Edition")
+    log.info(f"Saving CSV to: {OUTPUT_CSV}")
+    log.info("=" * 60)
+
+    existing     = load_existing(OUTPUT_CSV)
+    seen         = {_norm_url(r["url"]) for r in existing if r.get("url")}
+    rows_written: list[dict] = []
+    errors       = 0
+
+    pending = []
+    for i, target in enumerate(TARGETS, 1):
+        if _norm_url(target["url"]) in seen:
+            log.info(f"[{i:02d}/{len(TARGETS)}] SKIP  {target['source']} {target['date']}")
+            continue
+        pending.append((i, target))
+
+    scrape_sem = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+    llm_sem    = asyncio.Semaphore(LLM_CONCURRENCY)
+    is_new     = not OUTPUT_CSV.exists()
+
+    # One line-buffered handle for the whole run (each row is flushed as written).
+    with open(OUTPUT_CSV, "a", newline="", encoding="utf-8", buffering=1) as f, \
+         _make_parse_pool(len(pending)) as _parse_pool, \
+         shelve.open(str(HTTP_CACHE_PATH)) as _http_cache:
+        writer = csv.DictWriter(f, fieldnames=COLS)
+        if is_new:
+            writer.writeheader()
+
+        def write(scored: list[tuple[dict, dict]]) -> None:
+            for row in _build_rows(scored):
+                save_row(writer, row)
+                rows_written.append(row)
+                seen.add(_norm_url(row["url"]))
+
+        async with httpx.AsyncClient(**_CLIENT_KWARGS) as client:
+            # Scrapes stream into batches of LLM_BATCH_SIZE; each full batch is
+            # scored while the remaining pages are still downloading. Rows are
+            # written in finish-order; only this coroutine touches the CSV.
+            scrapes = [_scrape(client, scrape_sem, i, t) for i, t in pending]
+            batches: list[asyncio.Task] = []
+            batch:   list[dict]         = []
+            for fut in asyncio.as_completed(scrapes):
+                doc = await fut
+                if not doc["text"].strip():
+                    errors += 1
+                    write([(doc, {"Target_Entity": "None", "Action_Type": "None",
+                                  "Imminence_Score": 0.0, "Summary": "No content scraped."})])
+                    continue
+                batch.append(doc)
+                if len(batch) == LLM_BATCH_SIZE:
+                    batches.append(asyncio.create_task(_score_batch(client, llm_sem, batch)))
+                    batch = []
+            if batch:
+                batches.append(asyncio.create_task(_score_batch(client, llm_sem, batch)))
+
+            # Each scored batch is risk-scored in one vectorized pass as it lands
+            for fut in asyncio.as_completed(batches):
+                write(await fut)
 
     # ── Final summary ──────────────────────────────────────────────────────────
     log.info("=" * 60)
-    log.info(f"Done. {processed} new rows written.")
+    log.info(f"Done. {len(rows_written)} new rows written.")
     log.info(f"CSV saved to: {OUTPUT_CSV}")
     if errors:
         log.warning(f"{errors} URLs returned no content (may need updating).")
     log.info("=" * 60)
 
-    if OUTPUT_CSV.exists():
-        df = pd.read_csv(OUTPUT_CSV)
+    if existing or rows_written:
+        # Built from rows already in memory instead of re-reading the CSV;
+        # scores are shown exactly as stored in it
+        df = pd.DataFrame(existing + rows_written, columns=COLS)
+        df["Political_Risk_Score"] = pd.to_numeric(df["Political_Risk_Score"], errors="coerce")
         print(f"\n{'─'*72}")
         print(f"  POLITICAL RISK DATA — {len(df)} records")
         print(f"  File: {OUTPUT_CSV}")
@@ -441,5 +732,9 @@ def run():
         print(f"  Mean risk score : {df['Political_Risk_Score'].mean():.1f}")
 
 
+def run():
+    asyncio.run(main())
+
+
 if __name__ == "__main__":
     run()
\ No newline at end of file
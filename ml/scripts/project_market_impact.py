@@ -7,7 +7,9 @@ scripts/project_market_impact.py
 Model Design
 ------------
 A) Baseline path (per index / per stock):
-   - Fetch last `lookback_days` of daily closing prices via yfinance
+   - Fetch last `lookback_days` of daily closing prices from Yahoo's chart
+     API (all tickers concurrently), with one batched yfinance download for
+     any the chart API misses; closes are cached under artifacts/price_cache/
      (falls back to deterministic drift-only if internet is unavailable)
    - Estimate annualized drift mu and volatility sigma from log-returns
    - Project forward using Merton Jump Diffusion (JD) model:
@@ -82,7 +84,8 @@ From ml/ directory (project root):
         --jump_sigma 0.08 \\
         --bottom_day 12 \\
         --recovery_fraction 0.5 \\
-        --tau 20
+        --tau 20 \\
+        --dashboard_svg false
 
 Outputs
 -------
@@ -95,10 +98,13 @@ outputs/plots/nasdaq100_90d.png
 outputs/plots/dow_90d.png
 outputs/plots/sectors/{sector}_top10_90d.png   -- one plot per sector, each ticker labeled
 outputs/plots/sectors_top10_overview.png       -- sector dashboard grid
+outputs/plots/sectors_top10_overview.svg       -- vector copy (--dashboard_svg true only)
 """
 
 import argparse
+import asyncio
 import os
+import re
 import sys
 import warnings
 from datetime import datetime, timedelta
@@ -107,6 +113,16 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+try:   # optional: JIT-compiled shock/decay kernel
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:   # optional: multithreaded fused array expressions for the JD batch
+    import numexpr as ne
+except ImportError:
+    ne = None
+
 warnings.filterwarnings("ignore")
 
 # ── matplotlib: must use non-interactive backend before importing pyplot ──────
@@ -234,6 +250,12 @@ SECTOR_TICKERS: dict[str, list[str]] = {
     ],
 }
 
+# Yahoo Finance chart API (daily closes; tried before yfinance)
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+
+# On-disk yfinance history cache: one {ticker}.parquet of daily closes each
+PRICE_CACHE_DIR = Path(__file__).resolve().parent.parent / "artifacts" / "price_cache"
+
 # Fallback params for individual stocks when yfinance fails
 # (used only when source == "default"; JD is skipped in that case)
 _STOCK_FALLBACK = {
@@ -279,12 +301,22 @@ def parse_args() -> argparse.Namespace:
         default="true",
         help="Fetch real prices from yfinance: true/false (default: true)",
     )
+    p.add_argument(
+        "--no_cache", "--no-cache",
+        action="store_true",
+        help="Ignore the on-disk price cache and re-download all history",
+    )
     p.add_argument(
         "--seed",
         type=int,
         default=42,
         help="RNG seed for Merton Jump Diffusion reproducibility (default: 42)",
     )
+    p.add_argument(
+        "--dashboard_svg",
+        default="false",
+        help="Also write the sector dashboard as SVG: true/false (default: false)",
+    )
 
     # ── Merton Jump Diffusion parameters ─────────────────────────────────────
     # Default: lambda=1.0  =>  ~1 jump/year (moderate market events)
@@ -375,6 +407,10 @@ def _resolve_csv(path: str) -> Path:
     )
 
 
+# Any run of whitespace, "&" or "_" in a sector name becomes a single "_"
+_SECTOR_SEP_RE = re.compile(r"[\s&_]+")
+
+
 def load_and_validate(path: str) -> pd.DataFrame:
     """Load master CSV and validate required columns."""
     p = _resolve_csv(path)
@@ -392,13 +428,8 @@ def load_and_validate(path: str) -> pd.DataFrame:
     for col in move_cols:
         df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
 
-    # Normalize sector names: spaces/& -> _, collapse doubles
-    df["Sector"] = (
-        df["Sector"]
-        .str.strip()
-        .str.replace(r"[\s&]+", "_", regex=True)
-        .str.replace(r"_+", "_", regex=True)
-    )
+    # Normalize sector names: spaces/& -> _, collapse doubles (one regex pass)
+    df["Sector"] = df["Sector"].str.strip().str.replace(_SECTOR_SEP_RE, "_", regex=True)
 
     n_bad = df[move_cols].isna().any(axis=1).sum()
     if n_bad:
@@ -484,55 +515,308 @@ def shock_decay_curve(
     # Phase 1: linear build-up
     phase1 = total_impact_pct * np.minimum(days / max(bottom_day, 1), 1.0)
 
-    # Phase 2 multiplier: approaches (1 - recovery_fraction) asymptotically
-    phase2_mult = np.where(
-        days > bottom_day,
-        1.0 - recovery_fraction * (1.0 - np.exp(-(days - bottom_day) / tau)),
-        1.0,
+    # Phase 2 multiplier: approaches (1 - recovery_fraction) asymptotically.
+    # Branchless: for d <= bottom_day the exponent is 0, so the multiplier is 1.
+    phase2_mult = 1.0 - recovery_fraction * (
+        1.0 - np.exp(-np.maximum(days - bottom_day, 0.0) / tau)
     )
 
     return phase1 * phase2_mult
 
 
+def _apply_shock_numpy(
+    base: np.ndarray,
+    total_impact_pct: float,
+    bottom_day: int,
+    recovery_fraction: float,
+    tau: float,
+) -> np.ndarray:
+    """base * (1 + shock_decay_curve / 100) with plain NumPy."""
+    curve = shock_decay_curve(
+        len(base), total_impact_pct, bottom_day, recovery_fraction, tau
+    )
+    return base * (1.0 + curve / 100.0)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _apply_shock(base, total_impact_pct, bottom_day, recovery_fraction, tau):
+        """Fused shock_decay_curve + multiply: one pass, no temporary arrays."""
+        out = np.empty(base.shape[0])
+        ramp_len = max(bottom_day, 1)
+        for i in range(base.shape[0]):
+            d = i + 1.0
+            phase1 = total_impact_pct * min(d / ramp_len, 1.0)
+            phase2_mult = 1.0
+            if d > bottom_day:
+                phase2_mult = 1.0 - recovery_fraction * (1.0 - np.exp(-(d - bottom_day) / tau))
+            out[i] = base[i] * (1.0 + phase1 * phase2_mult / 100.0)
+        return out
+else:
+    _apply_shock = _apply_shock_numpy
+
+
+def apply_shock(
+    base: np.ndarray,
+    total_impact_pct: float,
+    bottom_day: int,
+    recovery_fraction: float,
+    tau: float,
+) -> np.ndarray:
+    """
+    Return base[d] * (1 + shock_decay_curve(...)[d] / 100) as a new array.
+
+    Uses the numba kernel when numba is installed; arguments are coerced to
+    fixed types so the kernel is only compiled once.
+    """
+    return _apply_shock(
+        np.asarray(base, dtype=float), float(total_impact_pct),
+        int(bottom_day), float(recovery_fraction), float(tau),
+    )
+
+
 # =============================================================================
 # Price data fetching
 # =============================================================================
 
-def _fetch_yfinance(ticker: str, lookback_days: int) -> dict | None:
+def _params_from_closes(closes: pd.Series) -> dict | None:
+    """Estimate drift / volatility from a series of daily closes (None if too short)."""
+    closes = closes.dropna()
+    if len(closes) < 20:
+        return None
+
+    log_ret     = np.log(closes / closes.shift(1)).dropna()
+    mu_daily    = float(log_ret.mean())
+    sigma_daily = float(log_ret.std())
+    last_price  = float(closes.iloc[-1])
+
+    return {
+        "last_price":   last_price,
+        "mu_annual":    mu_daily * TRADING_DAYS_PER_YEAR,
+        "sigma_annual": sigma_daily * (TRADING_DAYS_PER_YEAR ** 0.5),
+        "mu_daily_cal": mu_daily * TRADING_DAYS_PER_YEAR / CALENDAR_DAYS_PER_YEAR,
+        "source":       "yfinance",
+        "n_obs":        len(log_ret),
+    }
+
+
+def _load_cached_closes(ticker: str) -> pd.Series | None:
+    """Closes from the on-disk price cache, or None if absent/unreadable."""
+    try:
+        return pd.read_parquet(
+            PRICE_CACHE_DIR / f"{ticker}.parquet", engine="pyarrow"
+        )["Close"]
+    except Exception:
+        return None
+
+
+def _store_cached_closes(ticker: str, closes: pd.Series) -> None:
     """
-    Download historical prices and estimate drift / volatility.
-    Returns None on any failure.
+    Write closes to the on-disk price cache (best effort).
+
+    Written to a temp file and renamed into place, so a concurrent run never
+    reads a half-written parquet.
     """
+    path = PRICE_CACHE_DIR / f"{ticker}.parquet"
+    tmp  = path.with_name(f"{path.name}.{os.getpid()}.tmp")
     try:
-        import yfinance as yf
+        PRICE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        closes.to_frame("Close").to_parquet(tmp, engine="pyarrow")
+        os.replace(tmp, path)
+    except Exception:
+        tmp.unlink(missing_ok=True)
 
-        end   = datetime.today()
-        start = end - timedelta(days=int(lookback_days * 1.6))
 
-        hist = yf.download(
-            ticker, start=start, end=end, progress=False, auto_adjust=True
+async def _chart_closes(client, ticker: str, start: datetime, end: datetime) -> pd.Series | None:
+    """Adjusted daily closes for one ticker from Yahoo's chart API (None on failure)."""
+    try:
+        r = await client.get(
+            YAHOO_CHART_URL.format(ticker=ticker),
+            params={
+                "period1":  int(start.timestamp()),
+                "period2":  int(end.timestamp()),
+                "interval": "1d",
+                "events":   "div,split",
+            },
         )
-        if hist is None or len(hist) < 20:
-            return None
-
-        closes     = hist["Close"].squeeze().dropna()
-        log_ret    = np.log(closes / closes.shift(1)).dropna()
-        mu_daily   = float(log_ret.mean())
-        sigma_daily = float(log_ret.std())
-        last_price  = float(closes.iloc[-1])
-
-        return {
-            "last_price":   last_price,
-            "mu_annual":    mu_daily * TRADING_DAYS_PER_YEAR,
-            "sigma_annual": sigma_daily * (TRADING_DAYS_PER_YEAR ** 0.5),
-            "mu_daily_cal": mu_daily * TRADING_DAYS_PER_YEAR / CALENDAR_DAYS_PER_YEAR,
-            "source":       "yfinance",
-            "n_obs":        len(log_ret),
-        }
+        r.raise_for_status()
+        res = r.json()["chart"]["result"][0]
+        adj = res["indicators"].get("adjclose")
+        closes = adj[0]["adjclose"] if adj else res["indicators"]["quote"][0]["close"]
+        # exchange-local calendar dates, tz-naive like yfinance's index
+        ts = np.asarray(res["timestamp"], dtype="int64") + res["meta"].get("gmtoffset", 0)
+        index = pd.to_datetime(ts, unit="s").normalize()
+        return pd.Series(closes, index=index, dtype=float).dropna()
     except Exception:
         return None
 
 
+def _download_closes_chart(tickers: list, start: datetime, end: datetime) -> dict:
+    """
+    Fetch every ticker from Yahoo's chart API concurrently over one httpx
+    AsyncClient. Returns ticker -> closes for the tickers that came back.
+    """
+    try:
+        import httpx
+    except ImportError:
+        return {}
+
+    async def run():
+        async with httpx.AsyncClient(
+            headers={"User-Agent": "Mozilla/5.0"},
+            limits=httpx.Limits(max_connections=16),
+            timeout=httpx.Timeout(20.0, pool=None),
+        ) as client:
+            return await asyncio.gather(
+                *(_chart_closes(client, t, start, end) for t in tickers)
+            )
+
+    try:
+        results = asyncio.run(run())
+    except Exception:
+        return {}
+    return {t: c for t, c in zip(tickers, results) if c is not None and not c.empty}
+
+
+def _download_closes(tickers: list, start: datetime, end: datetime) -> dict:
+    """
+    Closes for all tickers: Yahoo's chart API first (concurrent, close prices
+    only), then one yfinance download (threaded inside yfinance) for any
+    tickers the chart API missed.
+    Returns ticker -> closes for the tickers that came back.
+    """
+    out = _download_closes_chart(tickers, start, end)
+    missing = [t for t in tickers if t not in out]
+    if missing:
+        out.update(_download_closes_yf(missing, start, end))
+    return out
+
+
+def _download_closes_yf(tickers: list, start: datetime, end: datetime) -> dict:
+    """
+    One yfinance download (threaded inside yfinance) for all tickers.
+    Returns ticker -> closes for the tickers that came back.
+    """
+    try:
+        import yfinance as yf
+
+        hist = yf.download(
+            tickers if len(tickers) > 1 else tickers[0],
+            start=start, end=end, progress=False, auto_adjust=True,
+            group_by="ticker", threads=True,
+        )
+    except Exception:
+        return {}
+    if hist is None or hist.empty:
+        return {}
+
+    if not isinstance(hist.columns, pd.MultiIndex):
+        return {tickers[0]: hist["Close"].squeeze().dropna()}
+    fetched = set(hist.columns.get_level_values(0))
+    return {t: hist[t]["Close"].dropna() for t in tickers if t in fetched}
+
+
+def _same_basis(old: pd.Series, tail: pd.Series) -> bool:
+    """
+    Whether a downloaded tail is adjusted on the same basis as the cached
+    closes: their overlapping dates must agree (no overlap counts as no).
+    """
+    common = old.index.intersection(tail.index)
+    if common.empty:
+        return False
+    return bool(np.allclose(old[common], tail[common], rtol=1e-6, atol=0.0))
+
+
+def _fetch_history(tickers: list, lookback_days: int, use_cache: bool = True) -> dict:
+    """
+    Daily closes covering the last `lookback_days` for each ticker.
+
+    Closes are cached in PRICE_CACHE_DIR/{ticker}.parquet. A cached ticker
+    whose last close is no older than yesterday is served from disk; stale
+    ones only download the tail since their last cached close, and all
+    stale/uncached tickers are downloaded together (see _download_closes).
+    use_cache=False skips the cache entirely (no reads, no writes).
+
+    Closes are split/dividend-adjusted, so a split or dividend since the
+    cache was written rescales the provider's whole history. The tail starts
+    on the last cached date; if that overlapping close no longer matches the
+    cached one, the ticker's full window is re-downloaded instead of
+    appending a tail on a different adjustment basis.
+    """
+    end   = datetime.today()
+    start = end - timedelta(days=int(lookback_days * 1.6))
+    fresh_after = pd.Timestamp(end.date()) - pd.Timedelta(days=1)
+
+    closes: dict = {}
+    cached: dict = {}
+    fetch_from: dict = {}
+    for ticker in tickers:
+        c = _load_cached_closes(ticker) if use_cache else None
+        # a cache that starts too late (e.g. after raising --lookback_days) is ignored
+        if c is None or c.empty or c.index.min() > pd.Timestamp(start) + pd.Timedelta(days=7):
+            fetch_from[ticker] = start
+        elif c.index.max() >= fresh_after:
+            closes[ticker] = c
+        else:
+            cached[ticker] = c
+            fetch_from[ticker] = c.index.max().to_pydatetime()
+
+    if fetch_from:
+        downloaded = _download_closes(list(fetch_from), min(fetch_from.values()), end)
+
+        rebased = [
+            t for t, old in cached.items()
+            if t in downloaded and not _same_basis(old, downloaded[t])
+        ]
+        if rebased:
+            downloaded.update(_download_closes(rebased, start, end))
+            for ticker in rebased:
+                if ticker in downloaded:
+                    del cached[ticker]   # replaced by the full re-download
+
+        for ticker in fetch_from:
+            new = downloaded.get(ticker)
+            old = cached.get(ticker)
+            if new is None or new.empty:
+                if old is not None:
+                    closes[ticker] = old   # stale, but better than the defaults
+                continue
+            if old is not None:
+                new = pd.concat([old, new])
+                new = new[~new.index.duplicated(keep="last")].sort_index()
+            if use_cache:
+                _store_cached_closes(ticker, new)
+            closes[ticker] = new
+
+    return {t: c[c.index >= pd.Timestamp(start)] for t, c in closes.items()}
+
+
+def _fetch_yfinance(ticker: str, lookback_days: int) -> dict | None:
+    """
+    Download historical prices and estimate drift / volatility.
+    Returns None on any failure.
+    """
+    closes = _fetch_history([ticker], lookback_days).get(ticker)
+    return _params_from_closes(closes) if closes is not None else None
+
+
+def fetch_yfinance_batch(tickers: list, lookback_days: int, use_cache: bool = True) -> dict:
+    """
+    Fetch every ticker's history in one batched pass (see _fetch_history)
+    and estimate drift / volatility per ticker. use_cache=False bypasses the
+    on-disk price cache.
+
+    Returns ticker -> params for the tickers that succeeded.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    out: dict = {}
+    for ticker, closes in _fetch_history(tickers, lookback_days, use_cache).items():
+        params = _params_from_closes(closes)
+        if params:
+            out[ticker] = params
+    return out
+
+
 def get_price_params(
     ticker: str,
     lookback_days: int,
@@ -540,10 +824,19 @@ def get_price_params(
     default_price: float,
     default_mu_annual: float,
     default_sigma_annual: float,
+    yf_params: dict | None = None,
 ) -> dict:
-    """Return price params dict, trying yfinance then falling back to defaults."""
+    """
+    Return price params dict, trying yfinance then falling back to defaults.
+
+    yf_params, if given, is a prefetched fetch_yfinance_batch() result and is
+    used instead of downloading the ticker again.
+    """
     if use_yfinance:
-        params = _fetch_yfinance(ticker, lookback_days)
+        if yf_params is not None:
+            params = yf_params.get(ticker)
+        else:
+            params = _fetch_yfinance(ticker, lookback_days)
         if params:
             return params
 
@@ -562,10 +855,10 @@ def get_price_params(
 # Merton Jump Diffusion model
 # =============================================================================
 
-def jump_diffusion_path(
-    last_price: float,
-    mu_annual: float,
-    sigma_annual: float,
+def simulate_paths(
+    last_price: np.ndarray,
+    mu_annual: np.ndarray,
+    sigma_annual: np.ndarray,
     horizon: int,
     dt: float,
     jump_lambda: float,
@@ -574,9 +867,9 @@ def jump_diffusion_path(
     rng: np.random.Generator,
 ) -> np.ndarray:
     """
-    Simulate a Merton Jump Diffusion price path (calendar-day stepping).
+    Simulate a batch of Merton Jump Diffusion price paths (calendar-day stepping).
 
-    Model (per daily step):
+    Model (per daily step, per asset):
         S_{t+dt} = S_t
                  * exp((mu - 0.5*sigma^2 - lambda*k)*dt + sigma*sqrt(dt)*Z)
                  * prod_{i=1}^{N(dt)} exp(mu_J + sigma_J * eps_i)
@@ -588,9 +881,9 @@ def jump_diffusion_path(
 
     Parameters
     ----------
-    last_price   : starting (today's) price
-    mu_annual    : annualized drift (from historical log-returns)
-    sigma_annual : annualized volatility (from historical log-returns)
+    last_price   : (n_assets,) starting (today's) prices
+    mu_annual    : (n_assets,) annualized drifts (from historical log-returns)
+    sigma_annual : (n_assets,) annualized volatilities (from historical log-returns)
     horizon      : number of daily steps to simulate
     dt           : time step in years; use DT_CALENDAR = 1/365.25
     jump_lambda  : Poisson intensity lambda (jumps/year); default 1.0
@@ -600,29 +893,41 @@ def jump_diffusion_path(
 
     Returns
     -------
-    np.ndarray of shape (horizon,) -- simulated prices for days 1..horizon
+    np.ndarray of shape (n_assets, horizon) -- simulated prices for days 1..horizon
     """
+    last_price   = np.asarray(last_price, dtype=float)
+    mu_annual    = np.asarray(mu_annual, dtype=float)[:, None]
+    sigma_annual = np.asarray(sigma_annual, dtype=float)[:, None]
+    shape        = (len(last_price), horizon)
+
     # k = E[jump factor] - 1 = exp(mu_J + 0.5*sigma_J^2) - 1
     k = np.exp(jump_mu + 0.5 * jump_sigma ** 2) - 1.0
 
-    prices = np.empty(horizon + 1)
-    prices[0] = last_price
+    # All randomness for the batch is drawn up front: one Z and one Poisson
+    # count per (asset, step), then a single pool of eps covering every jump.
+    Z       = rng.standard_normal(shape)
+    n_jumps = rng.poisson(jump_lambda * dt, shape)
+    eps     = rng.standard_normal(int(n_jumps.sum()))
 
-    for d in range(horizon):
-        Z = rng.standard_normal()
-        log_ret = (
-            (mu_annual - 0.5 * sigma_annual ** 2 - jump_lambda * k) * dt
-            + sigma_annual * np.sqrt(dt) * Z
-        )
+    # Sum each step's jumps; steps with no jumps get 0.
+    jump_sum = np.bincount(
+        np.repeat(np.arange(n_jumps.size), n_jumps.ravel()),
+        weights=jump_mu + jump_sigma * eps,
+        minlength=n_jumps.size,
+    ).reshape(shape)
 
-        n_jumps = rng.poisson(jump_lambda * dt)
-        if n_jumps > 0:
-            eps      = rng.standard_normal(n_jumps)
-            log_ret += (jump_mu + jump_sigma * eps).sum()
+    drift = (mu_annual - 0.5 * sigma_annual ** 2 - jump_lambda * k) * dt   # (n_assets, 1)
+    vol   = sigma_annual * np.sqrt(dt)                                       # (n_assets, 1)
+    p0    = last_price[:, None]
 
-        prices[d + 1] = prices[d] * np.exp(log_ret)
+    if ne is not None:
+        # numexpr fuses each expression into one multithreaded pass
+        log_ret = ne.evaluate("drift + vol * Z + jump_sum")
+        cum_ret = np.cumsum(log_ret, axis=1)
+        return ne.evaluate("p0 * exp(cum_ret)")
 
-    return prices[1:]  # days 1..horizon
+    log_ret = drift + vol * Z + jump_sum
+    return p0 * np.exp(np.cumsum(log_ret, axis=1))
 
 
 def _deterministic_baseline(
@@ -636,24 +941,30 @@ def _deterministic_baseline(
     return last_price * np.exp(mu_daily_cal * days)
 
 
-def build_path(
-    params: dict,
+def build_paths(
+    params_list: list,
     horizon: int,
     jump_lambda: float,
     jump_mu: float,
     jump_sigma: float,
     rng: np.random.Generator,
-) -> np.ndarray:
+) -> list:
     """
-    Choose Merton JD (if yfinance data available) or deterministic baseline.
+    Baseline path for each params dict, in order.
 
-    JD requires estimated sigma; falls back to drift-only when source='default'.
+    Assets with yfinance data (and an estimated sigma) are simulated together
+    in one Merton JD batch; the rest use the deterministic drift-only baseline.
     """
-    if params.get("source") == "yfinance" and params.get("sigma_annual", 0.0) > 0.0:
-        return jump_diffusion_path(
-            last_price   = params["last_price"],
-            mu_annual    = params["mu_annual"],
-            sigma_annual = params["sigma_annual"],
+    paths: list = [None] * len(params_list)
+    jd_idx = [
+        i for i, p in enumerate(params_list)
+        if p.get("source") == "yfinance" and p.get("sigma_annual", 0.0) > 0.0
+    ]
+    if jd_idx:
+        sims = simulate_paths(
+            last_price   = np.array([params_list[i]["last_price"] for i in jd_idx]),
+            mu_annual    = np.array([params_list[i]["mu_annual"] for i in jd_idx]),
+            sigma_annual = np.array([params_list[i]["sigma_annual"] for i in jd_idx]),
             horizon      = horizon,
             dt           = DT_CALENDAR,
             jump_lambda  = jump_lambda,
@@ -661,10 +972,16 @@ def build_path(
             jump_sigma   = jump_sigma,
             rng          = rng,
         )
+        for i, path in zip(jd_idx, sims):
+            paths[i] = path
+
     # Deterministic drift-only fallback (no internet / no historical data)
-    return _deterministic_baseline(
-        params["last_price"], params["mu_daily_cal"], horizon
-    )
+    for i, p in enumerate(params_list):
+        if paths[i] is None:
+            paths[i] = _deterministic_baseline(
+                p["last_price"], p["mu_daily_cal"], horizon
+            )
+    return paths
 
 
 def impacted_path(
@@ -675,10 +992,7 @@ def impacted_path(
     tau: float,
 ) -> np.ndarray:
     """Apply shock/decay curve on top of baseline path."""
-    curve = shock_decay_curve(
-        len(base), total_impact_pct, bottom_day, recovery_fraction, tau
-    )
-    return base * (1.0 + curve / 100.0)
+    return apply_shock(base, total_impact_pct, bottom_day, recovery_fraction, tau)
 
 
 def impacted_path_multi(
@@ -700,12 +1014,9 @@ def impacted_path_multi(
     This preserves the temporal shape of each sector's shock independently,
     rather than collapsing all contributions into a single blended curve.
     """
-    result = base.astype(float).copy()
+    result = base.astype(float)
     for impact_pct in sector_impacts:
-        curve = shock_decay_curve(
-            len(base), float(impact_pct), bottom_day, recovery_fraction, tau
-        )
-        result *= (1.0 + curve / 100.0)
+        result = apply_shock(result, impact_pct, bottom_day, recovery_fraction, tau)
     return result
 
 
@@ -743,13 +1054,11 @@ def compute_sector_index_paths(
     for sector, sector_df in df.groupby("Sector"):
         sector_paths: dict = {}
         for idx_key, col in _index_cols.items():
-            impacted = index_baselines[idx_key].astype(float).copy()
+            impacted = index_baselines[idx_key].astype(float)
             for _, row in sector_df.iterrows():
-                curve = shock_decay_curve(
-                    len(impacted), float(row[col]),
-                    bottom_day, recovery_fraction, tau
+                impacted = apply_shock(
+                    impacted, row[col], bottom_day, recovery_fraction, tau
                 )
-                impacted *= (1.0 + curve / 100.0)
             sector_paths[idx_key] = impacted
         result[str(sector)] = sector_paths
 
@@ -850,6 +1159,15 @@ def _annotate_end(ax, dates, arr, label, color, va="bottom"):
     )
 
 
+def _plot_axes(ax, figsize: tuple) -> tuple:
+    """(fig, ax, own_fig): a fresh figure if ax is None, else ax cleared for reuse."""
+    if ax is None:
+        fig, ax = plt.subplots(figsize=figsize)
+        return fig, ax, True
+    ax.cla()
+    return ax.figure, ax, False
+
+
 def plot_index(
     dates: pd.DatetimeIndex,
     base: np.ndarray,
@@ -861,8 +1179,14 @@ def plot_index(
     jump_mu: float,
     jump_sigma: float,
     out_path: str,
+    ax=None,
 ) -> None:
-    """Single index projection plot: baseline (JD or deterministic) + impacted."""
+    """
+    Single index projection plot: baseline (JD or deterministic) + impacted.
+
+    Pass `ax` to draw on an existing (13 x 6) axes, which is cleared first and
+    left open, instead of creating and closing a new figure.
+    """
     if params.get("source") == "yfinance":
         model_label = (
             f"Merton JD (lambda={jump_lambda}, mu_J={jump_mu:+.3f},"
@@ -871,7 +1195,7 @@ def plot_index(
     else:
         model_label = "Deterministic drift-only (fallback; no live data)"
 
-    fig, ax = plt.subplots(figsize=(13, 6))
+    fig, ax, own_fig = _plot_axes(ax, (13, 6))
 
     ax.plot(dates, base, color=cfg["color_base"], lw=2.5,
             label=f"Baseline [{model_label}]", zorder=3)
@@ -897,7 +1221,7 @@ def plot_index(
     ax.yaxis.set_major_formatter(FuncFormatter(_fmt_price))
     ax.xaxis.set_major_formatter(mdates.DateFormatter("%b %d"))
     ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=2))
-    plt.xticks(rotation=35, ha="right")
+    plt.setp(ax.get_xticklabels(), rotation=35, ha="right")
     ax.legend(fontsize=8, loc="upper left")
     ax.grid(True, alpha=0.25)
 
@@ -907,16 +1231,20 @@ def plot_index(
     fig.tight_layout()
     Path(out_path).parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out_path, dpi=150, bbox_inches="tight")
-    plt.close(fig)
+    if own_fig:
+        plt.close(fig)
     print(f"  Saved: {out_path}")
 
 
 def plot_single_sector(
     dates: pd.DatetimeIndex,
     sector: str,
-    stocks: dict,       # ticker -> {'baseline': arr, 'impacted': arr}
+    tickers: list,
+    bases: np.ndarray,  # (n_tickers, horizon), row k = tickers[k]
+    imps: np.ndarray,   # (n_tickers, horizon)
     impact_pct: float,
     out_path: str,
+    ax=None,
 ) -> None:
     """
     Per-sector plot with two layers:
@@ -929,34 +1257,32 @@ def plot_single_sector(
        - Dashed black line  = sector-average IMPACTED  (the "general trendline")
        - Dotted gray line   = sector-average BASELINE  (no-tariff reference)
        - Shaded fill between them shows the net tariff effect
+
+    Pass `ax` to draw on an existing (15 x 7) axes, which is cleared first and
+    left open, instead of creating and closing a new figure.
     """
-    fig, ax = plt.subplots(figsize=(15, 7))
+    fig, ax, own_fig = _plot_axes(ax, (15, 7))
 
-    cmap        = plt.get_cmap("tab10")
-    ticker_list = list(stocks.keys())
-    colors      = [cmap(i % 10) for i in range(len(ticker_list))]
+    cmap   = plt.get_cmap("tab10")
+    colors = [cmap(i % 10) for i in range(len(tickers))]
 
-    base_norms, imp_norms = [], []
-
-    for color, ticker in zip(colors, ticker_list):
-        paths = stocks[ticker]
-        b0    = paths["baseline"][0]
-        if b0 <= 0:
-            continue
-        bn  = paths["baseline"] / b0 * 100.0
-        in_ = paths["impacted"]  / b0 * 100.0
+    # Each stock normalized to its own Day-0 price = 100 (skip b0 <= 0)
+    valid     = bases[:, 0] > 0
+    scale     = 100.0 / bases[valid, :1]
+    base_norm = bases[valid] * scale
+    imp_norm  = imps[valid] * scale
 
+    valid_tickers = [t for t, ok in zip(tickers, valid) if ok]
+    valid_colors  = [c for c, ok in zip(colors, valid) if ok]
+    for color, ticker, in_ in zip(valid_colors, valid_tickers, imp_norm):
         # Individual stock: solid colored line for the impacted path, labeled by ticker
         ax.plot(dates, in_, color=color, lw=1.2, alpha=0.82, linestyle="-",
                 label=ticker, zorder=3)
 
-        base_norms.append(bn)
-        imp_norms.append(in_)
-
-    n_stocks = len(imp_norms)
-    if base_norms:
-        avg_b = np.mean(base_norms, axis=0)
-        avg_i = np.mean(imp_norms,  axis=0)
+    n_stocks = len(imp_norm)
+    if n_stocks:
+        avg_b = base_norm.mean(axis=0)
+        avg_i = imp_norm.mean(axis=0)
 
         # Sector baseline trendline: gray dotted
         ax.plot(dates, avg_b, color="gray", lw=1.8, linestyle=":",
@@ -983,25 +1309,31 @@ def plot_single_sector(
     ax.set_ylabel("Normalized Price (Day 0 = 100)")
     ax.xaxis.set_major_formatter(mdates.DateFormatter("%b %d"))
     ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=2))
-    plt.xticks(rotation=35, ha="right")
+    plt.setp(ax.get_xticklabels(), rotation=35, ha="right")
     ax.legend(fontsize=8, ncol=2, loc="upper left", framealpha=0.88)
     ax.grid(True, alpha=0.18)
 
     fig.tight_layout()
     Path(out_path).parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out_path, dpi=130, bbox_inches="tight")
-    plt.close(fig)
+    if own_fig:
+        plt.close(fig)
     print(f"  Saved: {out_path}")
 
 
 def plot_sector_dashboard(
     dates: pd.DatetimeIndex,
-    sector_data: dict,  # sector -> {stocks, sector_impact_pct}
+    sector_data: dict,  # sector -> {tickers, bases, imps, sector_impact_pct}
     out_path: str,
+    svg: bool = False,
 ) -> None:
     """
     Dashboard grid showing sector-average baseline vs impacted for all sectors.
     Each subplot is one sector; sector-average normalized to 100 at Day 0.
+
+    The grid spacing is fixed and the tight bounding box is computed once, so
+    the save does not re-run layout. With svg=True a vector copy is written
+    next to the PNG (same stem, .svg suffix).
     """
     sectors = sorted(sector_data.keys())
     n = len(sectors)
@@ -1020,20 +1352,15 @@ def plot_sector_dashboard(
         ax       = axes[row][col]
 
         info    = sector_data[sector]
-        stocks  = info["stocks"]
+        bases   = info["bases"]
+        imps    = info["imps"]
         imp_pct = info["sector_impact_pct"]
 
-        base_norms, imp_norms = [], []
-        for paths in stocks.values():
-            b0 = paths["baseline"][0]
-            if b0 <= 0:
-                continue
-            base_norms.append(paths["baseline"] / b0 * 100.0)
-            imp_norms.append(paths["impacted"]  / b0 * 100.0)
-
-        if base_norms:
-            avg_b = np.mean(base_norms, axis=0)
-            avg_i = np.mean(imp_norms,  axis=0)
+        valid = bases[:, 0] > 0
+        if valid.any():
+            scale = 100.0 / bases[valid, :1]
+            avg_b = (bases[valid] * scale).mean(axis=0)
+            avg_i = (imps[valid] * scale).mean(axis=0)
             ax.plot(dates, avg_b, color="#1565C0", lw=2.0, label="Baseline")
             ax.plot(dates, avg_i, color="#C62828", lw=2.0, linestyle="--",
                     label="Impacted")
@@ -1063,11 +1390,16 @@ def plot_sector_dashboard(
         "(sector-average normalized to 100 at Day 0; Blue=Baseline, Red=Impacted)",
         fontsize=13, y=1.01,
     )
-    fig.tight_layout()
+    fig.subplots_adjust(hspace=0.35, wspace=0.25, top=0.93)
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
     Path(out_path).parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(out_path, dpi=130, bbox_inches="tight")
-    plt.close(fig)
+    fig.savefig(out_path, dpi=130, bbox_inches=bbox)
     print(f"  Saved: {out_path}")
+    if svg:
+        svg_path = Path(out_path).with_suffix(".svg")
+        fig.savefig(svg_path, bbox_inches=bbox)
+        print(f"  Saved: {svg_path}")
+    plt.close(fig)
 
 
 # =============================================================================
@@ -1083,22 +1415,49 @@ def save_index_csv(
     Save index paths in long format.
     Columns: date, index, baseline_price, impacted_price, total_impact_pct
     """
-    rows = []
-    for key, res in index_results.items():
-        for date, b, i in zip(dates.date, res["baseline"], res["impacted"]):
-            rows.append({
-                "date":             date,
-                "index":            key,
-                "baseline_price":   round(float(b), 4),
-                "impacted_price":   round(float(i), 4),
-                "total_impact_pct": round(res["total_impact_pct"], 6),
-            })
+    keys = list(index_results)
+    n    = len(dates)
+    df = pd.DataFrame({
+        "date":             np.tile(dates.date, len(keys)),
+        "index":            np.repeat(keys, n),
+        "baseline_price":   np.round(np.concatenate([index_results[k]["baseline"] for k in keys]), 4),
+        "impacted_price":   np.round(np.concatenate([index_results[k]["impacted"] for k in keys]), 4),
+        "total_impact_pct": np.repeat([round(index_results[k]["total_impact_pct"], 6) for k in keys], n),
+    }, copy=False)
     p = Path(out_dir) / "index_paths.csv"
     p.parent.mkdir(parents=True, exist_ok=True)
-    pd.DataFrame(rows).to_csv(p, index=False)
+    df.to_csv(p, index=False)
     print(f"  Saved: {p}")
 
 
+def _stock_paths_frame(
+    dates: pd.DatetimeIndex,
+    sector: str,
+    info: dict,
+) -> pd.DataFrame:
+    """
+    Long-format stock paths for one sector (one row per ticker x date).
+
+    normalized_impacted_price: each ticker's impacted path scaled so Day 0 = 100
+    (matches the y-axis of the sector plot exactly)
+    """
+    tickers = info["tickers"]
+    bases   = info["bases"]
+    imps    = info["imps"]
+    n       = len(dates)
+    day0    = bases[:, :1]
+    scale   = np.divide(100.0, day0, out=np.ones_like(day0), where=day0 > 0)
+    return pd.DataFrame({
+        "date":                      np.tile(dates.date, len(tickers)),
+        "sector":                    sector,
+        "ticker":                    np.repeat(tickers, n),
+        "baseline_price":            np.round(bases.ravel(), 4),
+        "impacted_price":            np.round(imps.ravel(), 4),
+        "normalized_impacted_price": np.round((imps * scale).ravel(), 4),
+        "sector_total_impact_pct":   round(info["sector_impact_pct"], 6),
+    }, copy=False)
+
+
 def save_sector_csvs(
     dates: pd.DatetimeIndex,
     sector_data: dict,
@@ -1114,54 +1473,29 @@ def save_sector_csvs(
          Columns: date, sector, ticker, baseline_price, impacted_price,
                   sector_total_impact_pct
     """
-    sector_rows = []
+    sector_frames = []
     sectors_dir = Path(out_dir) / "sectors"
     sectors_dir.mkdir(parents=True, exist_ok=True)
 
     for sector, info in sector_data.items():
-        stocks  = info["stocks"]
-        imp_pct = info["sector_impact_pct"]
-
-        if not stocks:
+        if not info["tickers"]:
             continue
 
-        bases = np.array([v["baseline"] for v in stocks.values()])
-        imps  = np.array([v["impacted"]  for v in stocks.values()])
-        avg_b = bases.mean(axis=0)
-        avg_i = imps.mean(axis=0)
-
-        for date, b, i in zip(dates.date, avg_b, avg_i):
-            sector_rows.append({
-                "date":                    date,
-                "sector":                  sector,
-                "baseline_proxy_price":    round(float(b), 4),
-                "impacted_proxy_price":    round(float(i), 4),
-                "sector_total_impact_pct": round(imp_pct, 6),
-            })
+        sector_frames.append(pd.DataFrame({
+            "date":                    dates.date,
+            "sector":                  sector,
+            "baseline_proxy_price":    np.round(info["bases"].mean(axis=0), 4),
+            "impacted_proxy_price":    np.round(info["imps"].mean(axis=0), 4),
+            "sector_total_impact_pct": round(info["sector_impact_pct"], 6),
+        }, copy=False))
 
         # Per-sector long-format CSV (one row per date x ticker)
-        # normalized_impacted_price: each ticker's impacted path scaled so Day 0 = 100
-        # (matches the y-axis of the sector plot exactly)
-        stock_rows = []
-        for ticker, paths in stocks.items():
-            day0 = paths["baseline"][0]
-            scale = 100.0 / day0 if day0 > 0 else 1.0
-            for date, b, i in zip(dates.date, paths["baseline"], paths["impacted"]):
-                stock_rows.append({
-                    "date":                      date,
-                    "sector":                    sector,
-                    "ticker":                    ticker,
-                    "baseline_price":            round(float(b), 4),
-                    "impacted_price":            round(float(i), 4),
-                    "normalized_impacted_price": round(float(i) * scale, 4),
-                    "sector_total_impact_pct":   round(imp_pct, 6),
-                })
         csv_path = sectors_dir / f"{sector.lower()}_top10.csv"
-        pd.DataFrame(stock_rows).to_csv(csv_path, index=False)
+        _stock_paths_frame(dates, sector, info).to_csv(csv_path, index=False)
 
-    if sector_rows:
+    if sector_frames:
         p = Path(out_dir) / "sector_paths.csv"
-        pd.DataFrame(sector_rows).to_csv(p, index=False)
+        pd.concat(sector_frames, ignore_index=True).to_csv(p, index=False)
         print(f"  Saved: {p}")
         print(f"  Per-sector CSVs in: {sectors_dir}/")
 
@@ -1176,26 +1510,15 @@ def save_stock_paths_csv(
     Columns: date, sector, ticker, baseline_price, impacted_price,
              sector_total_impact_pct
     """
-    rows = []
-    for sector, info in sector_data.items():
-        imp_pct = info["sector_impact_pct"]
-        for ticker, paths in info["stocks"].items():
-            day0  = paths["baseline"][0]
-            scale = 100.0 / day0 if day0 > 0 else 1.0
-            for date, b, i in zip(dates.date, paths["baseline"], paths["impacted"]):
-                rows.append({
-                    "date":                      date,
-                    "sector":                    sector,
-                    "ticker":                    ticker,
-                    "baseline_price":            round(float(b), 4),
-                    "impacted_price":            round(float(i), 4),
-                    "normalized_impacted_price": round(float(i) * scale, 4),
-                    "sector_total_impact_pct":   round(imp_pct, 6),
-                })
-    if rows:
+    frames = [
+        _stock_paths_frame(dates, sector, info)
+        for sector, info in sector_data.items()
+        if info["tickers"]
+    ]
+    if frames:
         p = Path(out_dir) / "stock_paths.csv"
         p.parent.mkdir(parents=True, exist_ok=True)
-        pd.DataFrame(rows).to_csv(p, index=False)
+        pd.concat(frames, ignore_index=True).to_csv(p, index=False)
         print(f"  Saved: {p}")
 
 
@@ -1217,19 +1540,14 @@ def save_sector_index_csvs(
     out.mkdir(parents=True, exist_ok=True)
 
     for sector, paths in sorted(sector_index_paths.items()):
-        rows = [
-            {
-                "date":   date,
-                "SP500":  round(float(sp), 4),
-                "DOW":    round(float(dw), 4),
-                "NASDAQ": round(float(nq), 4),
-            }
-            for date, sp, dw, nq in zip(
-                dates.date, paths["sp500"], paths["dow"], paths["nasdaq"]
-            )
-        ]
+        df = pd.DataFrame({
+            "date":   dates.date,
+            "SP500":  np.round(paths["sp500"], 4),
+            "DOW":    np.round(paths["dow"], 4),
+            "NASDAQ": np.round(paths["nasdaq"], 4),
+        }, copy=False)
         p = out / f"{sector.lower()}_index_paths.csv"
-        pd.DataFrame(rows).to_csv(p, index=False)
+        df.to_csv(p, index=False)
         print(f"  Saved: {p}")
 
 
@@ -1270,8 +1588,9 @@ def main() -> None:
     args   = parse_args()
     use_yf = args.use_yfinance.lower() in ("true", "1", "yes")
 
-    # Seeded RNG for reproducible Merton JD paths
-    rng = np.random.default_rng(args.seed)
+    # Seeded RNG for reproducible Merton JD paths. One generator feeds the whole
+    # batched simulation; SFC64 is a faster bit generator than the PCG64 default.
+    rng = np.random.Generator(np.random.SFC64(args.seed))
 
     print("=" * 72)
     print("  90-Day Market Impact Projection  --  Tariff Scenario")
@@ -1280,6 +1599,7 @@ def main() -> None:
     print(f"  horizon_days       : {args.horizon_days}")
     print(f"  lookback_days      : {args.lookback_days}")
     print(f"  use_yfinance       : {use_yf}")
+    print(f"  price cache        : {'off' if args.no_cache else PRICE_CACHE_DIR}")
     print(f"  seed               : {args.seed}")
     print(f"  jump_lambda        : {args.jump_lambda}  (jumps/year)")
     print(f"  jump_mu            : {args.jump_mu}  (mean log-jump size)")
@@ -1306,10 +1626,28 @@ def main() -> None:
     dates = future_dates(args.horizon_days)
 
     # ------------------------------------------------------------------
-    # 4. Build index paths (Merton JD or deterministic fallback)
+    # 3b. Price history for every index and stock (one batched download)
     # ------------------------------------------------------------------
-    print("\n=== Building Index Price Paths ===")
-    index_results: dict = {}
+    sector_tickers = {
+        sector: resolve_sector_tickers(sector)[1][:10]  # top 10 per sector
+        for sector in sector_impacts_df["Sector"]
+    }
+    yf_params: dict = {}
+    if use_yf:
+        all_tickers = [cfg["ticker"] for cfg in INDEX_CFG.values()] + [
+            t for tickers in sector_tickers.values() for t in tickers
+        ]
+        print(f"\n=== Downloading Price History ({len(set(all_tickers))} tickers) ===")
+        yf_params = fetch_yfinance_batch(
+            all_tickers, args.lookback_days, use_cache=not args.no_cache
+        )
+        print(f"  yfinance data for {len(yf_params)} tickers")
+
+    # ------------------------------------------------------------------
+    # 4. Index price params
+    # ------------------------------------------------------------------
+    print("\n=== Fetching Index Price Params ===")
+    index_params: dict = {}
 
     for key, cfg in INDEX_CFG.items():
         print(f"\n  [{cfg['label']}]  ticker={cfg['ticker']}", end="  ")
@@ -1320,6 +1658,7 @@ def main() -> None:
             default_price       = cfg["default_price"],
             default_mu_annual   = cfg["default_mu_annual"],
             default_sigma_annual= cfg["default_sigma_annual"],
+            yf_params           = yf_params,
         )
         print(
             f"source={params['source']}"
@@ -1327,11 +1666,63 @@ def main() -> None:
             f"  mu_annual={params['mu_annual']:+.3f}"
             f"  sigma_annual={params.get('sigma_annual', 0):.3f}"
         )
+        index_params[key] = params
 
-        base = build_path(
-            params, args.horizon_days,
-            args.jump_lambda, args.jump_mu, args.jump_sigma, rng
-        )
+    # ------------------------------------------------------------------
+    # 5. Stock price params (top 10 per sector)
+    # ------------------------------------------------------------------
+    print("\n=== Fetching Stock Price Params (top 10 per sector) ===")
+    price_cache: dict = {}  # ticker -> params (avoid re-fetching same ticker)
+    stock_slots: list = []  # (sector, sector_impact_pct, ticker) per path
+
+    for _, row in sector_impacts_df.iterrows():
+        sector    = row["Sector"]
+        imp_pct   = float(row["sector_impact_pct"])
+        tickers   = sector_tickers[sector]
+
+        print(f"\n  [{sector}]  impact={imp_pct:+.4f}%  tickers={len(tickers)}")
+
+        for ticker in tickers:
+            if ticker not in price_cache:
+                p = yf_params.get(ticker)
+                if p is None:
+                    p = {
+                        "last_price":   _STOCK_FALLBACK["last_price"],
+                        "mu_annual":    _STOCK_FALLBACK["mu_annual"],
+                        "sigma_annual": _STOCK_FALLBACK["sigma_annual"],
+                        "mu_daily_cal": _STOCK_FALLBACK["mu_annual"] / CALENDAR_DAYS_PER_YEAR,
+                        "source":       "default",
+                        "n_obs":        0,
+                    }
+                price_cache[ticker] = p
+            stock_slots.append((sector, imp_pct, ticker))
+            sys.stdout.write(".")
+            sys.stdout.flush()
+
+        print()  # newline after dots
+
+    # ------------------------------------------------------------------
+    # 5b. Simulate every baseline path in one batch
+    #     (Merton JD or deterministic fallback)
+    # ------------------------------------------------------------------
+    print("\n=== Simulating Baseline Paths ===")
+    all_params = list(index_params.values()) + [
+        price_cache[ticker] for _, _, ticker in stock_slots
+    ]
+    all_bases = build_paths(
+        all_params, args.horizon_days,
+        args.jump_lambda, args.jump_mu, args.jump_sigma, rng
+    )
+    print(f"  Simulated {len(all_bases)} paths")
+    index_bases = dict(zip(index_params, all_bases[:len(index_params)]))
+    stock_bases = all_bases[len(index_params):]
+
+    # ------------------------------------------------------------------
+    # 5c. Index paths
+    # ------------------------------------------------------------------
+    index_results: dict = {}
+    for key, cfg in INDEX_CFG.items():
+        base = index_bases[key]
         # Apply each sector's tariff shock independently (multiplicative).
         # df[cfg["col"]] gives one weighted contribution per (Country, Sector) row.
         sector_impact_list = df[cfg["col"]].tolist()
@@ -1345,11 +1736,11 @@ def main() -> None:
             "impacted":         imp,
             "total_impact_pct": index_impacts[key],   # sum kept for display/CSV
             "cfg":              cfg,
-            "params":           params,
+            "params":           index_params[key],
         }
 
     # ------------------------------------------------------------------
-    # 4b. Sector-specific index paths (one CSV per sector)
+    # 5d. Sector-specific index paths (one CSV per sector)
     # ------------------------------------------------------------------
     print("\n=== Building Sector-Specific Index Paths ===")
     index_baselines = {key: res["baseline"] for key, res in index_results.items()}
@@ -1362,49 +1753,29 @@ def main() -> None:
     save_sector_index_csvs(dates, sector_index_paths, args.out_dir)
 
     # ------------------------------------------------------------------
-    # 5. Build sector + stock paths
+    # 5e. Sector + stock paths
     # ------------------------------------------------------------------
-    print("\n=== Building Sector & Stock Price Paths (top 10 per sector) ===")
+    # One entry per sector, stored as arrays rather than per-ticker dicts:
+    #   tickers: [str]; bases / imps: (n_tickers, horizon) C-contiguous,
+    #   row k belongs to tickers[k].
+    sector_rows: dict = {}  # sector -> (sector_impact_pct, [slot index, ...])
+    for k, (sector, imp_pct, _) in enumerate(stock_slots):
+        sector_rows.setdefault(sector, (imp_pct, []))[1].append(k)
+
+    # Every ticker in a sector gets the same shock curve, so the multiplier
+    # (1 + curve / 100) is built once per sector and broadcast over the rows.
     sector_data: dict = {}
-    price_cache: dict = {}  # ticker -> params (avoid re-fetching same ticker)
-
-    for _, row in sector_impacts_df.iterrows():
-        sector    = row["Sector"]
-        imp_pct   = float(row["sector_impact_pct"])
-        _, tickers = resolve_sector_tickers(sector)
-        tickers    = tickers[:10]  # top 10 per sector
-
-        print(f"\n  [{sector}]  impact={imp_pct:+.4f}%  tickers={len(tickers)}")
-
-        stocks: dict = {}
-        for ticker in tickers:
-            if ticker not in price_cache:
-                p = _fetch_yfinance(ticker, args.lookback_days) if use_yf else None
-                if p is None:
-                    p = {
-                        "last_price":   _STOCK_FALLBACK["last_price"],
-                        "mu_annual":    _STOCK_FALLBACK["mu_annual"],
-                        "sigma_annual": _STOCK_FALLBACK["sigma_annual"],
-                        "mu_daily_cal": _STOCK_FALLBACK["mu_annual"] / CALENDAR_DAYS_PER_YEAR,
-                        "source":       "default",
-                        "n_obs":        0,
-                    }
-                price_cache[ticker] = p
-
-            p = price_cache[ticker]
-            b = build_path(
-                p, args.horizon_days,
-                args.jump_lambda, args.jump_mu, args.jump_sigma, rng
-            )
-            i = impacted_path(
-                b, imp_pct, args.bottom_day, args.recovery_fraction, args.tau
-            )
-            stocks[ticker] = {"baseline": b, "impacted": i}
-            sys.stdout.write(".")
-            sys.stdout.flush()
-
-        print()  # newline after dots
-        sector_data[sector] = {"stocks": stocks, "sector_impact_pct": imp_pct}
+    ones = np.ones(args.horizon_days)
+    for sector, (imp_pct, rows) in sector_rows.items():
+        bases = np.ascontiguousarray([stock_bases[k] for k in rows], dtype=float)
+        mult  = impacted_path(ones, imp_pct, args.bottom_day, args.recovery_fraction, args.tau)
+        imps  = bases * mult
+        sector_data[sector] = {
+            "tickers":           [stock_slots[k][2] for k in rows],
+            "bases":             bases,
+            "imps":              imps,
+            "sector_impact_pct": imp_pct,
+        }
 
     # ------------------------------------------------------------------
     # 6. Sanity checks
@@ -1425,6 +1796,10 @@ def main() -> None:
     print("\n=== Generating Plots ===")
     plots_dir = Path(args.out_dir) / "plots"
 
+    # One figure per plot shape, cleared and redrawn for each plot of that shape
+    _, index_ax  = plt.subplots(figsize=(13, 6))
+    _, sector_ax = plt.subplots(figsize=(15, 7))
+
     # Index plots
     for key, res in index_results.items():
         plot_index(
@@ -1438,6 +1813,7 @@ def main() -> None:
             args.jump_mu,
             args.jump_sigma,
             str(plots_dir / res["cfg"]["plot_file"]),
+            ax=index_ax,
         )
 
     # Per-sector individual plots (filename: {sector}_top10_90d.png)
@@ -1446,16 +1822,22 @@ def main() -> None:
         plot_single_sector(
             dates,
             sector,
-            info["stocks"],
+            info["tickers"],
+            info["bases"],
+            info["imps"],
             info["sector_impact_pct"],
             str(sector_plots_dir / f"{sector.lower()}_top10_90d.png"),
+            ax=sector_ax,
         )
+    plt.close(index_ax.figure)
+    plt.close(sector_ax.figure)
 
     # Sector overview dashboard
     plot_sector_dashboard(
         dates,
         sector_data,
         str(plots_dir / "sectors_top10_overview.png"),
+        svg=args.dashboard_svg.lower() in ("true", "1", "yes"),
     )
 
     # ------------------------------------------------------------------
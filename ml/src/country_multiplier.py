@@ -13,12 +13,14 @@ DEFAULT_AUTH_WEIGHTS = {
     "UNKNOWN": 0.4,
 }
 
-def _norm_authority(x: str) -> str:
-    if x is None or (isinstance(x, float) and np.isnan(x)):
-        return "UNKNOWN"
-    s = str(x).strip().upper()
-    s = s.replace("-", "_").replace(" ", "_")
-    return s
+def _norm_authority(col: pd.Series) -> pd.Series:
+    """Upper-case, '-'/' ' -> '_' for a whole authority column; missing -> UNKNOWN."""
+    s = (
+        col.astype(str).str.strip().str.upper()
+        .str.replace("-", "_", regex=False)
+        .str.replace(" ", "_", regex=False)
+    )
+    return s.where(col.notna(), "UNKNOWN")
 
 def compute_country_multipliers(
     tariff_df: pd.DataFrame,
@@ -37,52 +39,57 @@ def compute_country_multipliers(
     if "event_date" not in tariff_df.columns:
         raise ValueError("tariff_df must contain 'event_date' (parsed) column")
 
-    df = tariff_df.copy()
-    df = df[df["event_date"].notna()].copy()
-    if df.empty:
+    # Work on masks and the few needed columns; tariff_df itself is never copied.
+    event_date = pd.to_datetime(tariff_df["event_date"])
+    if not event_date.notna().any():
         return {}
 
-    as_of = pd.to_datetime(df["event_date"]).max()
+    as_of = event_date.max()
     start = as_of - pd.Timedelta(days=window_days)
-    df = df[pd.to_datetime(df["event_date"]) >= start].copy()
+    keep = event_date >= start   # NaT compares False
 
-    if "country_std" not in df.columns:
+    if "country_std" in tariff_df.columns:
+        country = tariff_df.loc[keep, "country_std"]
+    elif "Geography" in tariff_df.columns:
         # fall back if needed
-        if "Geography" in df.columns:
-            df["country_std"] = df["Geography"].astype(str).str.strip().str.upper()
-        else:
-            raise ValueError("tariff_df must contain 'country_std' or 'Geography'")
-
-    df["country_std"] = df["country_std"].astype(str).str.strip().str.upper()
+        country = tariff_df.loc[keep, "Geography"]
+    else:
+        raise ValueError("tariff_df must contain 'country_std' or 'Geography'")
 
     # authority severity
     auth_col = None
     for c in ["legal_authority", "Legal authority", "authority"]:
-        if c in df.columns:
+        if c in tariff_df.columns:
             auth_col = c
             break
     if auth_col is None:
-        df["_auth"] = "UNKNOWN"
+        auth = pd.Series("UNKNOWN", index=country.index)
     else:
-        df["_auth"] = df[auth_col].apply(_norm_authority)
-
-    df["_auth_w"] = df["_auth"].map(lambda a: float(auth_weights.get(a, auth_weights.get("OTHER", 0.4))))
-
-    g = df.groupby("country_std", as_index=False).agg(
-        count_12m=("event_date", "count"),
-        severity_12m=("_auth_w", "sum"),
-    )
+        auth = _norm_authority(tariff_df.loc[keep, auth_col])
+
+    weights = pd.Series(auth_weights, dtype="float64")
+    country_std = country.astype(str).str.strip().str.upper().to_numpy()
+    auth_w = auth.map(weights).fillna(float(auth_weights.get("OTHER", 0.4))).to_numpy()
+
+    # Per-country count and severity sum as integer-coded bincounts. A missing
+    # country stays NaN under pandas' string dtype and factorizes to -1; drop
+    # those rows, as groupby does.
+    codes, countries = pd.factorize(country_std, sort=True)
+    if (codes < 0).any():
+        has_country = codes >= 0
+        codes, auth_w = codes[has_country], auth_w[has_country]
+    count_12m = np.bincount(codes, minlength=len(countries)).astype(float)
+    severity_12m = np.bincount(codes, weights=auth_w, minlength=len(countries))
 
     # raw score (stable, monotone)
-    g["raw_score"] = np.log1p(g["count_12m"].astype(float)) + 0.7 * np.log1p(g["severity_12m"].astype(float))
-    med = float(np.median(g["raw_score"].values)) if len(g) else 1.0
+    raw_score = np.log1p(count_12m) + 0.7 * np.log1p(severity_12m)
+    med = float(np.median(raw_score)) if len(raw_score) else 1.0
     if med <= 1e-9:
         med = 1.0
 
-    g["multiplier"] = g["raw_score"] / med
-    g["multiplier"] = g["multiplier"].clip(lower=min_mult, upper=max_mult)
+    multiplier = np.clip(raw_score / med, min_mult, max_mult)
 
-    return dict(zip(g["country_std"], g["multiplier"].round(4).tolist()))
+    return dict(zip(countries.tolist(), np.round(multiplier, 4).tolist()))
 
 def save_country_multipliers(mult: dict, out_path: str) -> None:
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
@@ -418,6 +418,40 @@ def _predict_from_pkg(entity: str, key_col: str, pkg: dict) -> dict:
     return result
 
 
+def _predict_probs_from_pkg(entities: list, key_col: str, pkg: dict) -> np.ndarray:
+    """
+    Unrounded tariff_risk_prob of _predict_from_pkg for many entities at once.
+
+    Picks each entity's latest panel row the same way, then imputes, scales and
+    scores them as one matrix — a single scaler.transform / predict_proba call
+    instead of one per entity.
+    """
+    panel = pkg["feature_panel"]
+    fill_values = pkg["fill_values"]
+    num_cols = pkg["num_cols"]
+
+    wanted = [str(e).strip().casefold() for e in entities]
+    keyed = panel.assign(_key=panel[key_col].astype(str).str.strip().str.casefold())
+    keyed = keyed[keyed["_key"].isin(wanted)]
+    latest = keyed.groupby("_key")["month_start"].transform("max")
+    picked = keyed[keyed["month_start"] == latest].groupby("_key", sort=False).head(1)
+
+    # Unknown entities become all-NaN rows and are fully imputed, as in the
+    # single-entity path (where a column without a fill value falls back to 0.0).
+    X = picked.set_index("_key").reindex(wanted)[num_cols]
+    fills = {c: fill_values[c] for c in num_cols if pd.notna(fill_values.get(c, np.nan))}
+    x_num = X.fillna(fills).fillna(0.0).to_numpy(dtype=float)
+
+    if pkg["mode"] == "probability" and pkg["model"] is not None:
+        if pkg.get("fit_on_scaled_num", False):
+            x_num = pkg["scaler"].transform(x_num)
+        return pkg["model"].predict_proba(x_num)[:, 1]
+
+    hw = pkg.get("weights") or _HEURISTIC_WEIGHTS
+    w_arr = np.array([hw.get(c, 0.0) for c in num_cols])
+    return 1.0 / (1.0 + np.exp(-(x_num @ w_arr)))
+
+
 def predict_blended(country: str, sector: str, country_pkg: dict, sector_pkg: dict | None = None) -> dict:
     country_norm = str(country).strip().upper()
     sector_norm = str(sector).strip()